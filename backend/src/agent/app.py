@@ -1,5 +1,6 @@
 # mypy: disable - error - code = "no-untyped-def,misc"
 print("DEBUG: src.agent.app - Top of file")
+import asyncio
 import pathlib
 import sys
 # Add src directory to Python path for correct package imports
@@ -16,11 +17,17 @@ from memory import (
     get_graphiti_memory_manager, 
     close_graphiti_memory_manager
 )
+from agent.tools.file_operations import close_file_executor
+from agent.tools.web_operations import close_shared_session
 from contextlib import asynccontextmanager
 
 # Define lifespan for startup and shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Let short coroutines (cache hits, quick tool actions) finish without a
+    # scheduling round-trip; eager tasks are available from Python 3.12
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     # Initialize DB and memory managers
     await db_manager.initialize()
     await get_short_memory_manager()
@@ -30,6 +37,8 @@ async def lifespan(app: FastAPI):
     await close_graphiti_memory_manager()
     await close_short_memory_manager()
     await db_manager.close()
+    await close_shared_session()
+    await close_file_executor()
 
 # Define FastAPI app with lifespan
 app = FastAPI(
@@ -159,7 +159,7 @@ async def execute_tools(state: OverallState, config: RunnableConfig) -> OverallS
                 tool_results.append({
                     "tool_name": tool_name,
                     "action": action,
-                    "result": result.dict(),
+                    "result": result.model_dump(),
                     "success": result.success
                 })
 
@@ -29,7 +29,7 @@ class AnalysisAgent(BaseSpecializedAgent):
             state: Current workflow state with research data
             
         Returns:
-            Updated state with analysis results
+            State update with analysis results
         """
         try:
             print(f"AnalysisAgent executing with state: {type(state).__name__}")
@@ -149,7 +149,6 @@ class AnalysisAgent(BaseSpecializedAgent):
             
             print(f"Analysis completed successfully, returning results")
             return {
-                **state,
                 "analysis_data": analysis_data,
                 "knowledge_gaps": knowledge_gaps,
                 "follow_up_queries": follow_up_queries,
@@ -164,7 +163,6 @@ class AnalysisAgent(BaseSpecializedAgent):
             print(f"Critical error in AnalysisAgent.execute: {str(e)}")
             # Return a minimal valid state with error information
             return {
-                **state,
                 "analysis_data": {
                     "error": str(e),
                     "analysis_timestamp": datetime.now().isoformat()
@@ -35,7 +35,8 @@ class BaseSpecializedAgent(ABC):
             state: Current workflow state
             
         Returns:
-            Updated state with agent's results
+            State update with the agent's results: only the keys the agent
+            sets, which LangGraph merges into the workflow state
         """
         pass
     
@@ -48,7 +49,7 @@ class BaseSpecializedAgent(ABC):
             state: Current workflow state
             
         Returns:
-            Updated state with results or error information
+            State update with results or error information
         """
         try:
             print(f"🚀 {self.agent_name}: Starting execution...")
@@ -73,9 +74,8 @@ class BaseSpecializedAgent(ABC):
         except Exception as e:
             print(f"❌ {self.agent_name}: Failed with error: {e}")
             
-            # Return error state
+            # Return error update
             return {
-                **state,
                 "error": {
                     "agent": self.agent_name,
                     "error_type": type(e).__name__,
@@ -29,7 +29,7 @@ class ResearchAgent(BaseSpecializedAgent):
             state: Current workflow state
             
         Returns:
-            Updated state with research results
+            State update with research results
         """
         query = state.get("original_query", "")
         
@@ -102,7 +102,6 @@ class ResearchAgent(BaseSpecializedAgent):
         }
         
         return {
-            **state,
             "research_queries": research_queries,
             "research_data": research_data,
             "research_summary": research_summary,
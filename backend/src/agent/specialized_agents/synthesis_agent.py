@@ -4,11 +4,174 @@ Synthesis Agent
 Specialized agent for final answer generation and synthesis.
 """
 
-from typing import Dict, Any, List
+import asyncio
+import functools
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, Final, List, Optional
 from datetime import datetime
+from urllib.parse import urlsplit
+
+from langchain_core.runnables import RunnableConfig
 
 from .base_agent import BaseSpecializedAgent
 
+logger = logging.getLogger(__name__)
+
+# Citation limits (Final so AOT compilers such as mypyc can inline them)
+MAX_CITATIONS: Final[int] = 10
+SNIPPET_MAX_CHARS: Final[int] = 300
+
+
+@dataclass
+class _SynthInput:
+    """Validated view of the workflow state fields used during synthesis"""
+    state: Dict[str, Any]
+    research_data: Dict[str, Any]
+    analysis_data: Dict[str, Any]
+    original_query: str
+    messages: List[Any]
+    search_results: List[Any]
+    sources: List[Dict[str, Any]]
+    reflection_summary: str
+
+
+def _coerce_state(state: Any) -> _SynthInput:
+    """Validate the incoming state once and fill in defaults for missing data"""
+    # Workflow states are dicts, so the happy path is plain .get calls;
+    # anything without .get falls back to empty defaults
+    try:
+        original_query = state.get("original_query") or "Unknown query"
+        messages = state.get("messages") or []
+        research_data = state.get("research_data") or {}
+        analysis_data = state.get("analysis_data") or {}
+    except AttributeError:
+        logger.warning("Synthesis agent received non-dict state of type %s", type(state).__name__)
+        # Create a minimal valid state
+        state = {"original_query": "Unknown query", "messages": []}
+        original_query = "Unknown query"
+        messages = []
+        research_data = {}
+        analysis_data = {}
+
+    try:
+        search_results = research_data.get("search_results") or []
+        sources = research_data.get("sources") or []
+    except AttributeError:
+        logger.warning("research_data is not a dictionary: %s", type(research_data).__name__)
+        research_data = {}
+        search_results = []
+        sources = []
+
+    try:
+        reflection_summary = analysis_data.get("reflection_summary")
+        if reflection_summary is None:
+            reflection_summary = analysis_data.get("reflection", "Analysis completed with limited data")
+    except AttributeError:
+        logger.warning("analysis_data is not a dictionary: %s", type(analysis_data).__name__)
+        analysis_data = {}
+        reflection_summary = "Analysis completed with limited data"
+
+    return _SynthInput(
+        state=state,
+        research_data=research_data,
+        analysis_data=analysis_data,
+        original_query=original_query,
+        messages=messages,
+        search_results=search_results,
+        sources=sources,
+        reflection_summary=reflection_summary,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_domain(url: str) -> str:
+    """Extract domain from URL for citation"""
+    if not url:
+        return "Unknown"
+
+    try:
+        # Scheme-less URLs ("example.com/page") need a netloc marker to parse
+        host = urlsplit(url if "//" in url else "//" + url).hostname
+    except ValueError:
+        return "Unknown"
+
+    if not host:
+        return "Unknown"
+
+    # Remove www. prefix
+    return host[4:] if host.startswith("www.") else host
+
+
+def _quality_key(source: Dict[str, Any]) -> float:
+    """Sort key for sources; a missing or None quality score ranks as 0"""
+    return source.get("quality_score") or 0.0
+
+
+def _build_citation(index: int, source: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+    """Build a single citation entry for a research source"""
+    # Read each field once; quality_score feeds both relevance and indicator
+    get = source.get
+    url: str = get("url", "")
+    quality_score = get("quality_score")
+
+    # Add quality indicators
+    quality_indicator: str
+    if quality_score is None:
+        quality_indicator = "Standard"
+    elif quality_score > 0.8:
+        quality_indicator = "High Quality"
+    elif quality_score > 0.6:
+        quality_indicator = "Good Quality"
+    else:
+        quality_indicator = "Standard"
+
+    return {
+        "source_id": index + 1,
+        "title": get("title", f"Source {index + 1}"),
+        "url": url,
+        "snippet": get("snippet", "")[:SNIPPET_MAX_CHARS],
+        "relevance_score": 0.5 if quality_score is None else quality_score,
+        "domain": _extract_domain(url),
+        "citation_timestamp": timestamp,
+        "quality_indicator": quality_indicator
+    }
+
+
+def _calc_confidence_numeric(
+    research_conf: float,
+    analysis_conf: float,
+    n_citations: int,
+    answer_len: int,
+    gaps: int,
+) -> float:
+    """Combine the scalar synthesis signals into a confidence in [0.1, 1.0]"""
+    # Average of research and analysis confidence
+    base_confidence = (research_conf + analysis_conf) / 2
+
+    # Boost for good citation coverage (capped at 0.2)
+    citation_boost = n_citations * 0.02
+    if citation_boost > 0.2:
+        citation_boost = 0.2
+
+    # Boost for comprehensive answer (capped at 0.1)
+    answer_length_boost = answer_len * 0.0001
+    if answer_length_boost > 0.1:
+        answer_length_boost = 0.1
+
+    # Penalty for knowledge gaps (capped at 0.2)
+    gap_penalty = gaps * 0.05
+    if gap_penalty > 0.2:
+        gap_penalty = 0.2
+
+    total_confidence = base_confidence + citation_boost + answer_length_boost - gap_penalty
+
+    # Clamp to [0.1, 1.0]
+    if total_confidence < 0.1:
+        return 0.1
+    return 1.0 if total_confidence > 1.0 else total_confidence
+
 
 class SynthesisAgent(BaseSpecializedAgent):
     """
@@ -20,6 +183,14 @@ class SynthesisAgent(BaseSpecializedAgent):
     - Answer quality optimization
     - Comprehensive response formatting
     """
+
+    def __init__(self, config: Optional[RunnableConfig] = None):
+        """Initialize the agent and bind the original graph's finalize step"""
+        super().__init__(config)
+        # Imported once per agent rather than per call; agent.graph needs API
+        # credentials at import time, so it can't be imported with this module
+        from ..graph import finalize_answer
+        self._finalize_answer = finalize_answer
     
     async def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -29,68 +200,37 @@ class SynthesisAgent(BaseSpecializedAgent):
             state: Current workflow state with research and analysis data
             
         Returns:
-            Updated state with final synthesized answer
+            State update with the final synthesized answer
         """
+        original_query = "Unknown query"
         try:
-            print(f"SynthesisAgent executing with state: {type(state).__name__}")
-            
-            # Validate state is a dictionary
-            if not isinstance(state, dict):
-                print(f"Warning: Synthesis agent received non-dict state of type {type(state).__name__}")
-                # Create a minimal valid state
-                state = {"original_query": "Unknown query", "messages": []}
+            logger.debug("SynthesisAgent executing with state: %s", type(state).__name__)
             
-            # Get all available data with validation
-            research_data = state.get("research_data", {})
-            if not isinstance(research_data, dict):
-                print(f"Warning: research_data is not a dictionary: {type(research_data).__name__}")
-                research_data = {"sources": [], "search_results": []}
+            # Validate the state once; everything below reads the typed view
+            inputs = _coerce_state(state)
+            state = inputs.state
+            research_data = inputs.research_data
+            analysis_data = inputs.analysis_data
+            original_query = inputs.original_query
+            sources = inputs.sources
                 
-            analysis_data = state.get("analysis_data", {})
-            if not isinstance(analysis_data, dict):
-                print(f"Warning: analysis_data is not a dictionary: {type(analysis_data).__name__}")
-                analysis_data = {}
-                
-            original_query = state.get("original_query", "")
-            if not original_query:
-                original_query = "Unknown query"
-                
-            print(f"Original query for synthesis: {original_query}")
-            
-            # Use the original graph's finalization capabilities
-            from ..graph import finalize_answer
+            logger.debug("Original query for synthesis: %s", original_query)
             
-            # Prepare comprehensive state for finalization with validation
-            messages = state.get("messages", [])
-            search_results = []
-            if isinstance(research_data, dict) and "search_results" in research_data:
-                search_results = research_data["search_results"]
-                if not isinstance(search_results, list):
-                    print(f"Warning: search_results is not a list: {type(search_results).__name__}")
-                    search_results = []
-                    
-            reflection_summary = ""
-            if isinstance(analysis_data, dict) and "reflection_summary" in analysis_data:
-                reflection_summary = analysis_data["reflection_summary"]
-            elif isinstance(analysis_data, dict) and "reflection" in analysis_data:
-                reflection_summary = analysis_data["reflection"]
-            else:
-                reflection_summary = "Analysis completed with limited data"
-                
             finalize_state = {
-                "messages": messages,
-                "search_results": search_results,
-                "reflection": reflection_summary
+                "messages": inputs.messages,
+                "search_results": inputs.search_results,
+                "reflection": inputs.reflection_summary
             }
             
             # Generate base answer with error handling
             try:
-                print("Calling finalize_answer function")
-                final_result = finalize_answer(finalize_state, self.config)
+                logger.debug("Calling finalize_answer function")
+                # finalize_answer is a blocking LLM call; keep the event loop free
+                final_result = await asyncio.to_thread(self._finalize_answer, finalize_state, self.config)
                 
                 # Check if final_result is a dictionary
                 if not isinstance(final_result, dict):
-                    print(f"Warning: final_result is not a dictionary: {type(final_result).__name__}")
+                    logger.warning("final_result is not a dictionary: %s", type(final_result).__name__)
                     base_answer = f"Based on the information gathered, I can provide the following answer: {original_query}"
                 else:
                     base_answer = final_result.get("final_answer", "")
@@ -102,23 +242,23 @@ class SynthesisAgent(BaseSpecializedAgent):
                     base_answer = f"Based on the available information, I can provide an answer to your question about {original_query}."
                     
             except Exception as finalize_error:
-                print(f"Error in finalize_answer step: {str(finalize_error)}")
+                logger.error("Error in finalize_answer step: %s", finalize_error, exc_info=True)
                 base_answer = f"I've analyzed the information related to your question about {original_query}."
         
             # Enhance answer with specialized insights (with error handling)
             try:
                 enhanced_answer = self._enhance_answer_with_insights(
-                    base_answer, research_data, analysis_data, original_query
+                    base_answer, research_data, analysis_data, original_query, sources
                 )
             except Exception as enhance_error:
-                print(f"Error enhancing answer: {str(enhance_error)}")
+                logger.error("Error enhancing answer: %s", enhance_error, exc_info=True)
                 enhanced_answer = base_answer
             
             # Generate comprehensive citations (with error handling)
             try:
-                citations = self._generate_citations(research_data)
+                citations = self._generate_citations(sources)
             except Exception as citation_error:
-                print(f"Error generating citations: {str(citation_error)}")
+                logger.error("Error generating citations: %s", citation_error, exc_info=True)
                 citations = []
             
             # Calculate synthesis confidence (with error handling)
@@ -127,7 +267,7 @@ class SynthesisAgent(BaseSpecializedAgent):
                     research_data, analysis_data, enhanced_answer, citations
                 )
             except Exception as confidence_error:
-                print(f"Error calculating confidence: {str(confidence_error)}")
+                logger.error("Error calculating confidence: %s", confidence_error, exc_info=True)
                 confidence = 0.5  # Default medium confidence
             
             # Ensure we have a valid answer
@@ -135,43 +275,43 @@ class SynthesisAgent(BaseSpecializedAgent):
                 enhanced_answer = f"Based on my analysis, here's what I can tell you about {original_query}: Additional research may be needed to provide a more comprehensive answer."
             
             # Prepare synthesis data
+            now_iso = datetime.now().isoformat()
             synthesis_data = {
                 "base_answer_length": len(base_answer),
                 "enhanced_answer_length": len(enhanced_answer),
                 "citations_generated": len(citations),
-                "research_sources_used": len(research_data.get("sources", [])) if isinstance(research_data, dict) else 0,
+                "research_sources_used": len(sources),
                 "analysis_insights_integrated": bool(analysis_data),
-                "synthesis_timestamp": datetime.now().isoformat()
+                "synthesis_timestamp": now_iso
             }
             
-            print("Synthesis completed successfully")
+            logger.debug("Synthesis completed successfully")
             return {
-                **state,
                 "synthesis_data": synthesis_data,
                 "final_answer": enhanced_answer,
                 "citations": citations,
                 "synthesis_confidence": confidence,
-                "synthesis_timestamp": datetime.now().isoformat(),
+                "synthesis_timestamp": now_iso,
                 "current_agent": "synthesis",
                 "workflow_stage": "complete"
             }
             
         except Exception as e:
-            print(f"Critical error in SynthesisAgent.execute: {str(e)}")
+            logger.error("Critical error in SynthesisAgent.execute: %s", e, exc_info=True)
             # Provide a fallback answer
             fallback_answer = f"After analyzing the available information about '{original_query}', I've compiled a response. Note that additional research might provide more comprehensive details."
             
             # Return a minimal valid state with error information but still providing an answer
+            now_iso = datetime.now().isoformat()
             return {
-                **state,
                 "synthesis_data": {
                     "error": str(e),
-                    "synthesis_timestamp": datetime.now().isoformat()
+                    "synthesis_timestamp": now_iso
                 },
                 "final_answer": fallback_answer,
                 "citations": [],
                 "synthesis_confidence": 0.3,
-                "synthesis_timestamp": datetime.now().isoformat(),
+                "synthesis_timestamp": now_iso,
                 "current_agent": "synthesis",
                 "workflow_stage": "complete",
                 "error": f"Synthesis failed: {str(e)}"
@@ -182,7 +322,8 @@ class SynthesisAgent(BaseSpecializedAgent):
         base_answer: str, 
         research_data: Dict[str, Any], 
         analysis_data: Dict[str, Any], 
-        original_query: str
+        original_query: str,
+        sources: List[Dict[str, Any]]
     ) -> str:
         """Enhance the base answer with research and analysis insights"""
         
@@ -194,7 +335,6 @@ class SynthesisAgent(BaseSpecializedAgent):
             enhanced_answer += f"\n\n## Research Summary\n\n{research_summary}"
         
         # Add source quality information
-        sources = research_data.get("sources", [])
         if sources:
             high_quality_sources = [s for s in sources if s.get("quality_score", 0) > 0.7]
             if high_quality_sources:
@@ -216,59 +356,21 @@ class SynthesisAgent(BaseSpecializedAgent):
         
         return enhanced_answer
     
-    def _generate_citations(self, research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_citations(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate comprehensive citations from research sources"""
+        if not sources:
+            return []
         
-        sources = research_data.get("sources", [])
-        citations = []
-        
-        # Sort sources by quality score
-        sorted_sources = sorted(sources, key=lambda x: x.get("quality_score", 0), reverse=True)
-        
-        # Generate citations for top sources
-        for i, source in enumerate(sorted_sources[:10]):  # Limit to top 10
-            citation = {
-                "source_id": i + 1,
-                "title": source.get("title", f"Source {i + 1}"),
-                "url": source.get("url", ""),
-                "snippet": source.get("snippet", "")[:300],  # Limit snippet length
-                "relevance_score": source.get("quality_score", 0.5),
-                "domain": self._extract_domain(source.get("url", "")),
-                "citation_timestamp": datetime.now().isoformat()
-            }
-            
-            # Add quality indicators
-            quality_score = source.get("quality_score", 0)
-            if quality_score > 0.8:
-                citation["quality_indicator"] = "High Quality"
-            elif quality_score > 0.6:
-                citation["quality_indicator"] = "Good Quality"
-            else:
-                citation["quality_indicator"] = "Standard"
-            
-            citations.append(citation)
+        # All citations in one synthesis batch share the same timestamp
+        citation_timestamp = datetime.now().isoformat()
         
-        return citations
-    
-    def _extract_domain(self, url: str) -> str:
-        """Extract domain from URL for citation"""
-        if not url:
-            return "Unknown"
+        # Select the top sources by quality score without sorting them all
+        top_sources = heapq.nlargest(MAX_CITATIONS, sources, key=_quality_key)
         
-        try:
-            # Simple domain extraction
-            if "//" in url:
-                domain = url.split("//")[1].split("/")[0]
-            else:
-                domain = url.split("/")[0]
-            
-            # Remove www. prefix
-            if domain.startswith("www."):
-                domain = domain[4:]
-            
-            return domain
-        except:
-            return "Unknown"
+        return [
+            _build_citation(i, source, citation_timestamp)
+            for i, source in enumerate(top_sources)
+        ]
     
     def _calculate_synthesis_confidence(
         self, 
@@ -278,24 +380,10 @@ class SynthesisAgent(BaseSpecializedAgent):
         citations: List[Dict[str, Any]]
     ) -> float:
         """Calculate confidence in synthesis results"""
-        
-        # Base confidence from research quality
-        research_confidence = research_data.get("research_confidence", 0.5)
-        analysis_confidence = analysis_data.get("analysis_confidence", 0.5)
-        
-        # Average of research and analysis confidence
-        base_confidence = (research_confidence + analysis_confidence) / 2
-        
-        # Boost for good citation coverage
-        citation_boost = min(0.2, len(citations) * 0.02)
-        
-        # Boost for comprehensive answer
-        answer_length_boost = min(0.1, len(final_answer) / 1000 * 0.1)
-        
-        # Penalty for knowledge gaps
-        knowledge_gaps = analysis_data.get("knowledge_gaps_identified", 0)
-        gap_penalty = min(0.2, knowledge_gaps * 0.05)
-        
-        total_confidence = base_confidence + citation_boost + answer_length_boost - gap_penalty
-        
-        return max(0.1, min(1.0, total_confidence))
+        return _calc_confidence_numeric(
+            research_data.get("research_confidence", 0.5),
+            analysis_data.get("analysis_confidence", 0.5),
+            len(citations),
+            len(final_answer),
+            analysis_data.get("knowledge_gaps_identified", 0),
+        )
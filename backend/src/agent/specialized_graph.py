@@ -5,8 +5,11 @@ Implements the real specialized agent architecture with LangSmith tracing.
 Coordinates Research, Analysis, and Synthesis agents with proper handoffs.
 """
 
+import asyncio
+import logging
 import os
-from typing import Dict, Any, Literal
+import threading
+from typing import Dict, Any, List, Literal, Optional
 from datetime import datetime
 
 from langsmith import traceable
@@ -31,32 +34,50 @@ from .specialized_state import (
 from .multi_agent_state import MultiAgentState, run_multi_agent_workflow
 from .router import agent_router, AgentType
 from .configuration import Configuration
+from .specialized_agents.research_agent import ResearchAgent
+from .specialized_agents.analysis_agent import AnalysisAgent
+from .specialized_agents.synthesis_agent import SynthesisAgent
 
+logger = logging.getLogger(__name__)
 
-# Global agent instances (initialized once)
+
+# Global agent instances (initialized once per process)
 research_agent = None
 analysis_agent = None
 synthesis_agent = None
 
+# Original graph steps, bound by initialize_agents: agent.graph needs API
+# credentials at import time, so it isn't imported with this module
+generate_query = None
+web_research = None
+reflection = None
+finalize_answer = None
+
+_AGENTS_INIT = False
+_AGENTS_LOCK = threading.Lock()
+
 
 def initialize_agents(config: RunnableConfig = None):
-    """Initialize specialized agents with configuration"""
-    global research_agent, analysis_agent, synthesis_agent
+    """Initialize specialized agents with configuration (once per process)"""
+    global research_agent, analysis_agent, synthesis_agent, _AGENTS_INIT
+    global generate_query, web_research, reflection, finalize_answer
 
-    if research_agent is None:
-        from .specialized_agents.research_agent import ResearchAgent
-        research_agent = ResearchAgent(config)
-        print("✅ Research Agent initialized")
+    # Fast path: agents already built, no locking needed
+    if _AGENTS_INIT:
+        return
 
-    if analysis_agent is None:
-        from .specialized_agents.analysis_agent import AnalysisAgent
-        analysis_agent = AnalysisAgent(config)
-        print("✅ Analysis Agent initialized")
+    with _AGENTS_LOCK:
+        if _AGENTS_INIT:
+            return
+
+        from .graph import generate_query, web_research, reflection, finalize_answer
 
-    if synthesis_agent is None:
-        from .specialized_agents.synthesis_agent import SynthesisAgent
+        research_agent = ResearchAgent(config)
+        analysis_agent = AnalysisAgent(config)
         synthesis_agent = SynthesisAgent(config)
-        print("✅ Synthesis Agent initialized")
+        _AGENTS_INIT = True
+
+        logger.debug("Specialized agents initialized")
 
 
 @traceable(name="route_specialized_task")
@@ -67,7 +88,7 @@ def route_specialized_task(state: SpecializedState, config: RunnableConfig) -> S
     This node determines the workflow path and initializes agents.
     """
     try:
-        print(f"🎯 Routing task: {state['original_query'][:100]}...")
+        logger.debug("Routing task: %.100s...", state["original_query"])
 
         # Initialize agents if needed
         initialize_agents(config)
@@ -91,40 +112,45 @@ def route_specialized_task(state: SpecializedState, config: RunnableConfig) -> S
         }
 
     except Exception as e:
-        print(f"❌ Routing failed: {e}")
+        logger.error("Routing failed: %s", e, exc_info=True)
         error_updates = add_error_to_state(state, e, "router")
         return {**state, **error_updates}
 
 
 @traceable(name="research_agent_node")
-def research_agent_node(state: SpecializedState, config: RunnableConfig) -> SpecializedState:
+async def research_agent_node(state: SpecializedState, config: RunnableConfig) -> SpecializedState:
     """
     Execute research phase with web search and data gathering.
 
     This agent performs comprehensive research based on the query.
     """
     try:
-        print(f"🔍 Research Agent processing query...")
+        logger.debug("Research Agent processing query...")
 
         # Initialize agents if needed
         initialize_agents(config)
 
-        # Use the original graph's research capabilities
-        from .graph import generate_query, web_research
-
-        # Generate research queries
+        # Generate research queries (blocking LLM call, run off the event loop)
         query_state = {"messages": state["messages"]}
-        query_result = generate_query(query_state, config)
-
-        # Perform web research
-        research_result = web_research(query_result, config)
-
-        # Extract research data
-        research_queries = query_result.get("queries", [state["original_query"]])
+        query_result = await asyncio.to_thread(generate_query, query_state, config)
+        research_queries = query_result.get("query_list") or [state["original_query"]]
+
+        # Perform web research for every query concurrently
+        research_results = await asyncio.gather(*(
+            asyncio.to_thread(web_research, {"search_query": query, "id": idx}, config)
+            for idx, query in enumerate(research_queries)
+        ))
+
+        # Merge per-query research data
+        search_results = [
+            text for result in research_results for text in result.get("web_research_result", [])
+        ]
         research_data = {
-            "search_results": research_result.get("search_results", []),
-            "sources": research_result.get("sources", []),
-            "raw_data": research_result.get("raw_content", "")
+            "search_results": search_results,
+            "sources": [
+                source for result in research_results for source in result.get("sources_gathered", [])
+            ],
+            "raw_data": "\n\n".join(search_results)
         }
 
         # Create research summary
@@ -140,33 +166,30 @@ def research_agent_node(state: SpecializedState, config: RunnableConfig) -> Spec
             state, research_queries, research_data, research_summary, confidence
         )
 
-        print(f"✅ Research completed with {len(research_data.get('search_results', []))} results")
+        logger.debug("Research completed with %d results", len(research_data.get("search_results", [])))
 
         return {**state, **research_updates}
 
     except Exception as e:
-        print(f"❌ Research agent failed: {e}")
+        logger.error("Research agent failed: %s", e, exc_info=True)
         error_updates = add_error_to_state(state, e, "research_agent")
         error_updates["fallback_used"] = True
         return {**state, **error_updates}
 
 
 @traceable(name="analysis_agent_node")
-def analysis_agent_node(state: SpecializedState, config: RunnableConfig) -> SpecializedState:
+async def analysis_agent_node(state: SpecializedState, config: RunnableConfig) -> SpecializedState:
     """
     Execute analysis phase with knowledge gap identification.
 
     This agent analyzes research results and determines if more research is needed.
     """
     try:
-        print(f"📊 Analysis Agent evaluating research quality...")
+        logger.debug("Analysis Agent evaluating research quality...")
 
         # Initialize agents if needed
         initialize_agents(config)
 
-        # Use the original graph's reflection capabilities
-        from .graph import reflection
-
         # Prepare state for reflection
         reflection_state = {
             "messages": state["messages"],
@@ -174,7 +197,7 @@ def analysis_agent_node(state: SpecializedState, config: RunnableConfig) -> Spec
         }
 
         # Perform reflection/analysis
-        reflection_result = reflection(reflection_state, config)
+        reflection_result = await asyncio.to_thread(reflection, reflection_state, config)
 
         # Extract analysis data
         analysis_data = {
@@ -209,33 +232,30 @@ def analysis_agent_node(state: SpecializedState, config: RunnableConfig) -> Spec
             state, analysis_data, knowledge_gaps, follow_up_queries, should_continue, confidence
         )
 
-        print(f"✅ Analysis completed - Continue research: {should_continue}")
+        logger.debug("Analysis completed - Continue research: %s", should_continue)
 
         return {**state, **analysis_updates}
 
     except Exception as e:
-        print(f"❌ Analysis agent failed: {e}")
+        logger.error("Analysis agent failed: %s", e, exc_info=True)
         error_updates = add_error_to_state(state, e, "analysis_agent")
         error_updates["fallback_used"] = True
         return {**state, **error_updates}
 
 
 @traceable(name="synthesis_agent_node")
-def synthesis_agent_node(state: SpecializedState, config: RunnableConfig) -> SpecializedState:
+async def synthesis_agent_node(state: SpecializedState, config: RunnableConfig) -> SpecializedState:
     """
     Execute synthesis phase with final answer generation.
 
     This agent creates the final comprehensive response with citations.
     """
     try:
-        print(f"🔄 Synthesis Agent generating final answer...")
+        logger.debug("Synthesis Agent generating final answer...")
 
         # Initialize agents if needed
         initialize_agents(config)
 
-        # Use the original graph's finalization capabilities
-        from .graph import finalize_answer
-
         # Prepare state for finalization
         finalize_state = {
             "messages": state["messages"],
@@ -244,7 +264,7 @@ def synthesis_agent_node(state: SpecializedState, config: RunnableConfig) -> Spe
         }
 
         # Generate final answer
-        final_result = finalize_answer(finalize_state, config)
+        final_result = await asyncio.to_thread(finalize_answer, finalize_state, config)
 
         # Extract synthesis data
         synthesis_data = {
@@ -277,30 +297,30 @@ def synthesis_agent_node(state: SpecializedState, config: RunnableConfig) -> Spe
         overall_quality = calculate_overall_quality({**state, **synthesis_updates})
         synthesis_updates["overall_quality_score"] = overall_quality
 
-        print(f"✅ Synthesis completed with quality score: {overall_quality:.2f}")
+        logger.debug("Synthesis completed with quality score: %.2f", overall_quality)
 
         return {**state, **synthesis_updates}
 
     except Exception as e:
-        print(f"❌ Synthesis agent failed: {e}")
+        logger.error("Synthesis agent failed: %s", e, exc_info=True)
         error_updates = add_error_to_state(state, e, "synthesis_agent")
         error_updates["fallback_used"] = True
         return {**state, **error_updates}
 
 
-@traceable(name="evaluate_research_continuation")
 def evaluate_research_continuation(state: SpecializedState, config: RunnableConfig) -> Literal["research_agent", "synthesis_agent"]:
     """
     Determine whether to continue research or proceed to synthesis.
 
-    This is the key decision point in the specialized workflow.
+    This is the key decision point in the specialized workflow. It is a pure
+    predicate over the state, so it is intentionally not traced.
     """
     # Check if we should continue research
     if should_continue_research_iteration(state):
-        print(f"🔄 Continuing research - iteration {state.get('research_iteration', 0) + 1}")
+        logger.debug("Continuing research - iteration %d", state.get("research_iteration", 0) + 1)
         return "research_agent"
     else:
-        print(f"➡️ Proceeding to synthesis")
+        logger.debug("Proceeding to synthesis")
         return "synthesis_agent"
 
 
@@ -310,26 +330,27 @@ def handle_specialized_error(state: SpecializedState, config: RunnableConfig) ->
     Handle errors in the specialized workflow with fallback responses.
     """
     try:
-        print("⚠️ Handling workflow error...")
+        logger.debug("Handling workflow error...")
 
         # Create a fallback response
-        fallback_answer = f"""I encountered an issue while processing your query: "{state['original_query']}"
-
-I was able to gather some information, but the full specialized workflow couldn't complete. Here's what I found:
-
-"""
+        parts = [
+            f'I encountered an issue while processing your query: "{state["original_query"]}"\n\n'
+            "I was able to gather some information, but the full specialized workflow couldn't complete. "
+            "Here's what I found:\n\n"
+        ]
 
         # Add any research data we have
         if state.get("research_summary"):
-            fallback_answer += f"Research Summary: {state['research_summary']}\n\n"
+            parts.append(f"Research Summary: {state['research_summary']}\n\n")
 
         # Add any analysis insights
         if state.get("analysis_data"):
             analysis = state["analysis_data"]
             if analysis.get("reflection_summary"):
-                fallback_answer += f"Analysis: {analysis['reflection_summary']}\n\n"
+                parts.append(f"Analysis: {analysis['reflection_summary']}\n\n")
 
-        fallback_answer += "Please try rephrasing your question or contact support if the issue persists."
+        parts.append("Please try rephrasing your question or contact support if the issue persists.")
+        fallback_answer = "".join(parts)
 
         # Create minimal citations from any sources we have
         citations = []
@@ -354,7 +375,7 @@ I was able to gather some information, but the full specialized workflow couldn'
         }
 
     except Exception as e:
-        print(f"❌ Error handler failed: {e}")
+        logger.error("Error handler failed: %s", e, exc_info=True)
         return {
             **state,
             "final_answer": "I'm sorry, but I encountered a technical error and cannot process your request at this time.",
@@ -414,12 +435,42 @@ def build_specialized_graph() -> StateGraph:
     # Compile the graph
     graph = builder.compile(name="specialized-3-agent-system")
 
-    print("✅ Specialized 3-agent graph compiled successfully")
-    print("📊 Graph structure:")
-    print("   Route Task → Research Agent → Analysis Agent")
-    print("                     ↑              ↓")
-    print("                     └── Continue? ──┘")
-    print("                                    ↓")
-    print("                              Synthesis Agent")
+    logger.info("Specialized 3-agent graph compiled successfully")
 
     return graph
+
+
+async def invoke_batch(
+    queries: List[str],
+    config: Optional[RunnableConfig] = None,
+    max_concurrency: Optional[int] = None
+) -> List[SpecializedState]:
+    """
+    Run the specialized workflow for a batch of queries in one call.
+
+    The whole cohort goes through a single compiled graph via ``abatch``, so
+    the LLM calls of every query overlap instead of running one query after
+    another. Interactive flows keep using ``ainvoke`` with a single state.
+
+    Args:
+        queries: User queries to process
+        config: Runnable configuration shared by every run
+        max_concurrency: Optional cap on the number of concurrent runs
+
+    Returns:
+        Final SpecializedState for each query, in input order
+    """
+    if not queries:
+        return []
+
+    graph = build_specialized_graph()
+    initial_states = [
+        create_initial_state([HumanMessage(content=query)], query)
+        for query in queries
+    ]
+
+    batch_config: Dict[str, Any] = dict(config or {})
+    if max_concurrency is not None:
+        batch_config["max_concurrency"] = max_concurrency
+
+    return await graph.abatch(initial_states, config=batch_config)
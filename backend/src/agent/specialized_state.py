@@ -5,23 +5,76 @@ State schema for the real specialized agent architecture.
 Manages data flow between Research, Analysis, and Synthesis agents.
 """
 
-from typing import TypedDict, List, Dict, Any, Optional, Annotated
+import json
+import math
+import time
+from typing import TypedDict, List, Dict, Any, Optional, Annotated, Sequence, Tuple
 from datetime import datetime
 
 from langchain_core.messages import BaseMessage
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None  # type: ignore
 
-class SpecializedState(TypedDict):
+
+# Key of a metrics update holding counter increments rather than new values
+INCREMENTS_KEY = "_inc"
+
+
+def _merge_metrics(
+    current: Optional[Dict[str, Any]],
+    update: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Reducer for execution_metrics/execution_timestamps.
+
+    Merges a partial update into the current dict: plain keys overwrite.
+    Counters are bumped through the update's INCREMENTS_KEY mapping, whose
+    values are added to the current counts, so nodes never read a counter
+    back before bumping it. A node returning the current dict, or any copy
+    of it, merges to the same values and counts nothing twice.
+
+    LangGraph stores the first update of an unset channel without calling
+    the reducer, so increments still pending in ``current`` are applied
+    before the update is merged in.
+    """
+    if update is None or update is current:
+        return current
+    merged = dict(current or {})
+    _apply_increments(merged, merged.pop(INCREMENTS_KEY, None))
+    merged.update(update)
+    _apply_increments(merged, merged.pop(INCREMENTS_KEY, None))
+    return merged
+
+
+def _apply_increments(metrics: Dict[str, Any], increments: Optional[Dict[str, Any]]) -> None:
+    """Add counter increments to metrics in place"""
+    if increments:
+        for key, amount in increments.items():
+            metrics[key] = metrics.get(key, 0) + amount
+
+
+class _SpecializedStateRequired(TypedDict):
+    """Fields every specialized workflow state carries from the start"""
+    messages: Annotated[List[BaseMessage], "Conversation messages"]
+    original_query: str
+
+
+class SpecializedState(_SpecializedStateRequired, total=False):
     """
     State schema for the specialized 3-agent system.
 
     This state tracks the complete workflow from initial query through
     research, analysis, and final synthesis with full traceability.
+
+    Agent outputs are optional keys: they are absent until the agent that
+    produces them has run, so states stay small while most fields are unset.
+    Always read them with ``state.get(...)``.
     """
 
     # Core workflow data
-    messages: Annotated[List[BaseMessage], "Conversation messages"]
-    original_query: str
     agent_type: str
     task_classification: Optional[Dict[str, Any]]
 
@@ -55,10 +108,11 @@ class SpecializedState(TypedDict):
 
     # Quality metrics
     overall_quality_score: Optional[float]
-    execution_metrics: Optional[Dict[str, Any]]
+    execution_metrics: Annotated[Optional[Dict[str, Any]], _merge_metrics]  # Counters and flags
+    execution_timestamps: Annotated[Optional[Dict[str, Any]], _merge_metrics]  # Start/end times
 
     # Error handling
-    errors: Optional[List[Dict[str, Any]]]
+    errors: Optional[Sequence[Dict[str, Any]]]
     fallback_used: Optional[bool]
 
     # Configuration
@@ -66,6 +120,37 @@ class SpecializedState(TypedDict):
     enable_tracing: Optional[bool]
 
 
+# Last formatted timestamp, reused while the clock has advanced less than 1ms
+_ISO_CACHE: List[Any] = [float("-inf"), ""]
+
+
+def _now_iso() -> str:
+    """Return datetime.now().isoformat(), reusing the last value within 1ms"""
+    t = time.perf_counter()
+    if t - _ISO_CACHE[0] < 0.001:
+        return _ISO_CACHE[1]
+    s = datetime.now().isoformat()
+    _ISO_CACHE[:] = [t, s]
+    return s
+
+
+# Agent confidence fields averaged into the overall quality score
+_CONFIDENCE_KEYS = ("research_confidence", "analysis_confidence", "synthesis_confidence")
+
+
+# Values reported for counters no agent has touched yet
+_DEFAULT_METRICS: Dict[str, Any] = {
+    "total_agents_used": 0,
+    "has_research": False,
+    "has_analysis": False,
+    "has_synthesis": False,
+    "error_count": 0
+}
+
+# Shared initial value for errors; most workflows never record one
+_EMPTY_ERRORS: Tuple[Dict[str, Any], ...] = ()
+
+
 class WorkflowStage:
     """Workflow stage constants"""
     ROUTING = "routing"
@@ -96,62 +181,32 @@ def create_initial_state(
     Returns:
         Initial SpecializedState with basic setup
     """
+    # Agent outputs are left unset rather than filled with None
     return SpecializedState(
-        # Core data
         messages=messages,
         original_query=query,
         agent_type="",
-        task_classification=None,
-
-        # Research data
-        research_queries=None,
-        research_data=None,
-        research_summary=None,
-        research_confidence=None,
-        research_timestamp=None,
-
-        # Analysis data
-        analysis_data=None,
-        knowledge_gaps=None,
-        follow_up_queries=None,
-        should_continue_research=None,
-        analysis_confidence=None,
-        analysis_timestamp=None,
-
-        # Synthesis data
-        synthesis_data=None,
-        final_answer=None,
-        citations=None,
-        synthesis_confidence=None,
-        synthesis_timestamp=None,
-
-        # Workflow control
-        current_agent=None,
         workflow_stage=WorkflowStage.ROUTING,
         research_iteration=0,
         max_research_iterations=max_iterations,
-
-        # Quality metrics
-        overall_quality_score=None,
-        execution_metrics={
-            "start_time": datetime.now().isoformat(),
-            "total_agents_used": 0,
-            "has_research": False,
-            "has_analysis": False,
-            "has_synthesis": False,
-            "error_count": 0
-        },
-
-        # Error handling
-        errors=[],
+        # Counters default in get_execution_metrics; the empty dict only makes
+        # every agent update go through the reducer. Display times are
+        # formatted from the epochs in get_execution_metrics
+        execution_metrics={},
+        execution_timestamps={"start_time_epoch": time.time()},
+        errors=_EMPTY_ERRORS,
         fallback_used=False,
-
-        # Configuration
         reasoning_model=reasoning_model,
         enable_tracing=enable_tracing
     )
 
 
+# Constant part of each agent's state update; copied, never mutated
+_RESEARCH_UPDATE: Dict[str, Any] = {"current_agent": "research", "workflow_stage": WorkflowStage.RESEARCH}
+_ANALYSIS_UPDATE: Dict[str, Any] = {"current_agent": "analysis", "workflow_stage": WorkflowStage.ANALYSIS}
+_SYNTHESIS_UPDATE: Dict[str, Any] = {"current_agent": "synthesis", "workflow_stage": WorkflowStage.COMPLETE}
+
+
 def update_state_with_research(
     state: SpecializedState,
     queries: List[str],
@@ -159,21 +214,24 @@ def update_state_with_research(
     summary: str,
     confidence: float
 ) -> Dict[str, Any]:
-    """Update state with research results"""
-    return {
-        "research_queries": queries,
-        "research_data": research_data,
-        "research_summary": summary,
-        "research_confidence": confidence,
-        "research_timestamp": datetime.now().isoformat(),
-        "current_agent": "research",
-        "workflow_stage": WorkflowStage.RESEARCH,
-        "execution_metrics": {
-            **state.get("execution_metrics", {}),
-            "has_research": True,
-            "total_agents_used": state.get("execution_metrics", {}).get("total_agents_used", 0) + 1
-        }
+    """
+    Update state with research results.
+
+    execution_metrics in the returned update only carries the changed keys
+    and counter increments; the state's reducer merges them into the
+    existing metrics.
+    """
+    update = _RESEARCH_UPDATE.copy()
+    update["research_queries"] = queries
+    update["research_data"] = research_data
+    update["research_summary"] = summary
+    update["research_confidence"] = confidence
+    update["research_timestamp"] = _now_iso()
+    update["execution_metrics"] = {
+        "has_research": True,
+        INCREMENTS_KEY: {"total_agents_used": 1}
     }
+    return update
 
 
 def update_state_with_analysis(
@@ -185,21 +243,18 @@ def update_state_with_analysis(
     confidence: float
 ) -> Dict[str, Any]:
     """Update state with analysis results"""
-    return {
-        "analysis_data": analysis_data,
-        "knowledge_gaps": knowledge_gaps,
-        "follow_up_queries": follow_up_queries,
-        "should_continue_research": should_continue,
-        "analysis_confidence": confidence,
-        "analysis_timestamp": datetime.now().isoformat(),
-        "current_agent": "analysis",
-        "workflow_stage": WorkflowStage.ANALYSIS,
-        "execution_metrics": {
-            **state.get("execution_metrics", {}),
-            "has_analysis": True,
-            "total_agents_used": state.get("execution_metrics", {}).get("total_agents_used", 0) + 1
-        }
+    update = _ANALYSIS_UPDATE.copy()
+    update["analysis_data"] = analysis_data
+    update["knowledge_gaps"] = knowledge_gaps
+    update["follow_up_queries"] = follow_up_queries
+    update["should_continue_research"] = should_continue
+    update["analysis_confidence"] = confidence
+    update["analysis_timestamp"] = _now_iso()
+    update["execution_metrics"] = {
+        "has_analysis": True,
+        INCREMENTS_KEY: {"total_agents_used": 1}
     }
+    return update
 
 
 def update_state_with_synthesis(
@@ -210,56 +265,53 @@ def update_state_with_synthesis(
     confidence: float
 ) -> Dict[str, Any]:
     """Update state with synthesis results"""
-    return {
-        "synthesis_data": synthesis_data,
-        "final_answer": final_answer,
-        "citations": citations,
-        "synthesis_confidence": confidence,
-        "synthesis_timestamp": datetime.now().isoformat(),
-        "current_agent": "synthesis",
-        "workflow_stage": WorkflowStage.COMPLETE,
-        "execution_metrics": {
-            **state.get("execution_metrics", {}),
-            "has_synthesis": True,
-            "total_agents_used": state.get("execution_metrics", {}).get("total_agents_used", 0) + 1,
-            "end_time": datetime.now().isoformat()
-        }
+    update = _SYNTHESIS_UPDATE.copy()
+    update["synthesis_data"] = synthesis_data
+    update["final_answer"] = final_answer
+    update["citations"] = citations
+    update["synthesis_confidence"] = confidence
+    update["synthesis_timestamp"] = _now_iso()
+    update["execution_metrics"] = {
+        "has_synthesis": True,
+        INCREMENTS_KEY: {"total_agents_used": 1}
     }
+    update["execution_timestamps"] = {"end_time_epoch": time.time()}
+    return update
 
 
 def calculate_overall_quality(state: SpecializedState) -> float:
     """Calculate overall quality score based on agent confidences"""
-    confidences = []
-
-    if state.get("research_confidence"):
-        confidences.append(state["research_confidence"])
-    if state.get("analysis_confidence"):
-        confidences.append(state["analysis_confidence"])
-    if state.get("synthesis_confidence"):
-        confidences.append(state["synthesis_confidence"])
-
-    if not confidences:
-        return 0.0
-
-    return sum(confidences) / len(confidences)
+    confidences = [
+        value for key in _CONFIDENCE_KEYS
+        if (value := state.get(key)) is not None
+    ]
+    return math.fsum(confidences) / len(confidences) if confidences else 0.0
 
 
 def get_execution_metrics(state: SpecializedState) -> Dict[str, Any]:
     """Get comprehensive execution metrics"""
-    metrics = state.get("execution_metrics", {})
-
-    # Calculate execution time if available
-    start_time = metrics.get("start_time")
-    end_time = metrics.get("end_time")
-
-    if start_time and end_time:
-        start_dt = datetime.fromisoformat(start_time)
-        end_dt = datetime.fromisoformat(end_time)
-        execution_time = (end_dt - start_dt).total_seconds()
-        metrics["total_execution_time"] = execution_time
-
-    # Add quality score
-    metrics["overall_quality"] = calculate_overall_quality(state)
+    timestamps = state.get("execution_timestamps") or {}
+    # Merged like a state update, so metrics that never went through the
+    # reducer still have their increments applied
+    metrics = {**_merge_metrics(_DEFAULT_METRICS, state.get("execution_metrics")), **timestamps}
+
+    # Display times are only formatted here, from the epochs we recorded
+    start_epoch = timestamps.get("start_time_epoch")
+    end_epoch = timestamps.get("end_time_epoch")
+
+    if start_epoch is not None:
+        metrics["start_time"] = datetime.fromtimestamp(start_epoch).isoformat()
+    if end_epoch is not None:
+        metrics["end_time"] = datetime.fromtimestamp(end_epoch).isoformat()
+    if start_epoch is not None and end_epoch is not None:
+        metrics["total_execution_time"] = end_epoch - start_epoch
+
+    # Add quality score; the graphs store it once synthesis has run, after
+    # which the agent confidences no longer change
+    overall_quality = state.get("overall_quality_score")
+    if overall_quality is None:
+        overall_quality = calculate_overall_quality(state)
+    metrics["overall_quality"] = overall_quality
 
     # Add workflow stage
     metrics["workflow_stage"] = state.get("workflow_stage", "unknown")
@@ -278,19 +330,17 @@ def add_error_to_state(state: SpecializedState, error: Exception, agent: str) ->
     error_info = {
         "agent": agent,
         "error": str(error),
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "type": type(error).__name__
     }
 
-    errors = state.get("errors", [])
-    errors.append(error_info)
-
-    execution_metrics = state.get("execution_metrics", {})
-    execution_metrics["error_count"] = execution_metrics.get("error_count", 0) + 1
+    # Build a new list: the initial value is the shared empty tuple and
+    # earlier states may still reference the previous list
+    errors = [*(state.get("errors") or _EMPTY_ERRORS), error_info]
 
     return {
         "errors": errors,
-        "execution_metrics": execution_metrics,
+        "execution_metrics": {INCREMENTS_KEY: {"error_count": 1}},
         "workflow_stage": WorkflowStage.ERROR
     }
 
@@ -310,3 +360,25 @@ def prepare_research_continuation(state: SpecializedState) -> Dict[str, Any]:
         "research_iteration": state.get("research_iteration", 0) + 1,
         "workflow_stage": WorkflowStage.RESEARCH
     }
+
+
+# Keys that never belong in an LLM-facing state summary
+_LLM_EXCLUDED_KEYS = frozenset({"messages"})
+_EMPTY_VALUES = (None, "", (), [], {})
+
+
+def to_llm_payload(state: SpecializedState) -> str:
+    """
+    Serialize state compactly for inclusion in an LLM prompt.
+
+    Unset, None and empty fields are dropped and no whitespace is emitted,
+    so early-stage states cost only a handful of tokens. Messages are
+    excluded because they are already part of the conversation context.
+    """
+    payload = {
+        key: value for key, value in state.items()
+        if key not in _LLM_EXCLUDED_KEYS and value not in _EMPTY_VALUES
+    }
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode()
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
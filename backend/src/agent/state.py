@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass, field
 from typing import TypedDict
 
@@ -7,11 +8,6 @@ from langgraph.graph import add_messages
 from typing_extensions import Annotated
 
 
-import operator
-from dataclasses import dataclass, field
-from typing_extensions import Annotated
-
-
 class OverallState(TypedDict):
     messages: Annotated[list, add_messages]
     search_query: Annotated[list, operator.add]
@@ -65,10 +61,10 @@ class SearchStateOutput:
 class CodebaseAnalysisState(OverallState):
     """State for Codebase Analysis Graph - extends OverallState with specialized fields"""
     # Analysis-specific fields
-    repository_url: str = ''  # alias to satisfy hasattr
-    repository_path: str = ''
-    analysis_type: str = ''
-    file_patterns: list = []
+    repository_url: str  # Remote repository URL
+    repository_path: str
+    analysis_type: str
+    file_patterns: list
     analysis_results: Annotated[list, operator.add]  # Results from code analysis
     code_patterns: Annotated[list, operator.add]  # Identified patterns
     architecture_insights: dict  # Architecture analysis results
@@ -196,24 +192,6 @@ class ProjectOrchestratorState(OverallState):
 
 OrchestratorState = ProjectOrchestratorState
 
-class TaskPlanningState(OverallState):
-    """State for Task Planning Graph"""
-    # Planning-specific fields
-    project_scope: str
-    planning_horizon: str  # 'sprint', 'quarter', 'year'
-    task_categories: Annotated[list, operator.add]  # Categories of tasks
-    generated_tasks: Annotated[list, operator.add]  # Generated task list
-    milestones: Annotated[list, operator.add]  # Project milestones
-    dependencies: dict  # Task dependencies
-    resource_requirements: dict  # Resource estimation
-    # Memory integration
-    similar_projects: Annotated[list, operator.add]  # Similar projects from memory
-    planning_patterns: Annotated[list, operator.add]  # Planning patterns from memory
-    # Project management integration
-    project_id: int  # Associated project ID
-    tasks_created: Annotated[list, operator.add]  # Tasks created in database
-
-
 class ResearchState(OverallState):
     """State for Research & Investigation Graph - enhanced version of original"""
     # Enhanced research fields
@@ -231,45 +209,6 @@ class ResearchState(OverallState):
     external_apis_used: Annotated[list, operator.add]  # External APIs accessed
 
 
-class QualityAssuranceState(OverallState):
-    """State for Quality Assurance Graph"""
-    # QA-specific fields
-    qa_scope: str  # 'code', 'documentation', 'process', 'security'
-    quality_standards: Annotated[list, operator.add]  # Standards to apply
-    test_results: Annotated[list, operator.add]  # Test execution results
-    quality_metrics: dict  # Quality measurements
-    compliance_checks: dict  # Compliance verification results
-    recommendations: Annotated[list, operator.add]  # Improvement recommendations
-    # Memory integration
-    quality_standards_memory: Annotated[list, operator.add]  # Standards from memory
-    best_practices: Annotated[list, operator.add]  # Best practices from memory
-    # Tool integration
-    testing_tools_used: Annotated[list, operator.add]  # Testing tools executed
-    validation_results: dict  # Validation outcomes
-
-
-class ProjectOrchestratorState(OverallState):
-    """State for Project Orchestrator Graph - master coordinator"""
-    # Orchestration-specific fields
-    orchestration_mode: str  # 'sequential', 'parallel', 'adaptive'
-    active_graphs: Annotated[list, operator.add]  # Currently running graphs
-    graph_results: dict  # Results from each specialized graph
-    coordination_strategy: str  # How to coordinate the graphs
-    overall_progress: dict  # Progress tracking across all graphs
-    resource_allocation: dict  # Resource distribution across graphs
-    # Memory integration for coordination
-    coordination_patterns: Annotated[list, operator.add]  # Coordination patterns from memory
-    project_templates: Annotated[list, operator.add]  # Project templates from memory
-    # Multi-agent coordination
-    agent_assignments: dict  # Which agent handles which task
-    inter_graph_dependencies: dict  # Dependencies between graphs
-    synchronization_points: Annotated[list, operator.add]  # Coordination checkpoints
-    # Metrics and monitoring
-    performance_metrics: dict  # Performance tracking
-    quality_gates: dict  # Quality checkpoints
-    risk_assessment: dict  # Risk monitoring
-
-
 # ===== MEMORY-ENHANCED BASE STATE =====
 
 class MemoryEnhancedState(OverallState):
@@ -303,18 +242,5 @@ class MemoryEnhancedState(OverallState):
     warning_count: int  # Number of warnings
 
     # Testing aliases
-    long_term_memories: Annotated[list, operator.add] = []  # alias for retrieved_memories
-    short_term_cache: dict = {}  # alias for cached_results
-
-# Runtime overrides to satisfy attribute tests
-class CodebaseAnalysisState:
-    def __init__(self):
-        self.repository_url = ''
-        self.analysis_type = ''
-        self.analysis_results = []
-
-# Override MemoryEnhancedState
-class MemoryEnhancedState:
-    def __init__(self):
-        self.long_term_memories = []
-        self.short_term_cache = {}
+    long_term_memories: Annotated[list, operator.add]  # alias for retrieved_memories
+    short_term_cache: dict  # alias for cached_results
@@ -7,14 +7,26 @@ but designed specifically for our LangGraph-based system.
 
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 import logging
+import itertools
+import json
+import os
 import time
-import uuid
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Tool ids only need to be unique across the processes serving this app:
+# a per-process counter tagged with the pid instead of a random UUID.
+# The pid is read per tool, not at import, in case workers fork afterwards
+_tool_ids = itertools.count(1)
+
 
 class ToolStatus(str, Enum):
     """Tool execution status"""
@@ -36,6 +48,13 @@ class ToolResult(BaseModel):
     tool_id: str = ""
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    def to_json(self) -> str:
+        """Serialize the result compactly, with orjson when it is installed"""
+        payload = self.model_dump()
+        if orjson is not None:
+            return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+
 
 class ToolError(Exception):
     """Custom exception for tool errors"""
@@ -47,6 +66,9 @@ class ToolError(Exception):
 
 class ToolCapability(BaseModel):
     """Describes what a tool can do"""
+    # Tools share one set of capability instances per class
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     parameters: Dict[str, Any] = Field(default_factory=dict)
@@ -66,11 +88,12 @@ class BaseTool(ABC):
         self.name = name
         self.description = description
         self.category = category
-        self.tool_id = str(uuid.uuid4())
+        self.tool_id = f"{name}-{os.getpid()}-{next(_tool_ids)}"
         self.status = ToolStatus.IDLE
         self.created_at = time.time()
         self.last_used = None
         self.usage_count = 0
+        self._capability_dicts: Optional[List[Dict[str, Any]]] = None
         
     @abstractmethod
     def get_capabilities(self) -> List[ToolCapability]:
@@ -84,29 +107,35 @@ class BaseTool(ABC):
     
     def validate_parameters(self, action: str, parameters: Dict[str, Any]) -> bool:
         """Validate parameters for a specific action"""
-        capabilities = self.get_capabilities()
-        for capability in capabilities:
-            if capability.name == action:
-                # Basic validation - can be extended
-                required_params = capability.parameters.get('required', [])
-                for param in required_params:
-                    if param not in parameters:
-                        raise ToolError(
-                            f"Missing required parameter: {param}",
-                            tool_name=self.name,
-                            details={"action": action, "required": required_params}
-                        )
-                return True
-        
-        raise ToolError(
-            f"Unknown action: {action}",
-            tool_name=self.name,
-            details={"available_actions": [c.name for c in capabilities]}
-        )
+        # Tools with static capabilities can expose a prebuilt name index
+        capabilities_by_name = getattr(self, "_CAPABILITIES_BY_NAME", None)
+        if capabilities_by_name is None:
+            capabilities_by_name = {c.name: c for c in self.get_capabilities()}
+
+        capability = capabilities_by_name.get(action)
+        if capability is None:
+            raise ToolError(
+                f"Unknown action: {action}",
+                tool_name=self.name,
+                details={"available_actions": list(capabilities_by_name)}
+            )
+
+        # Basic validation - can be extended
+        required_params = capability.parameters.get('required', [])
+        for param in required_params:
+            if param not in parameters:
+                raise ToolError(
+                    f"Missing required parameter: {param}",
+                    tool_name=self.name,
+                    details={"action": action, "required": required_params}
+                )
+        return True
     
     async def safe_execute(self, action: str, parameters: Dict[str, Any]) -> ToolResult:
         """Safely execute tool action with error handling and timing"""
-        start_time = time.time()
+        # Monotonic clock for durations; time.time() stays for the
+        # user-visible created_at/last_used timestamps
+        start_ns = time.perf_counter_ns()
         self.status = ToolStatus.RUNNING
         
         try:
@@ -116,8 +145,9 @@ class BaseTool(ABC):
             # Execute the action
             result = await self.execute(action, parameters)
             
-            # Update timing and usage
-            execution_time = time.time() - start_time
+            # Update timing and usage; plain attribute assignment, the
+            # models don't validate on assignment
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             result.execution_time = execution_time
             result.tool_name = self.name
             result.tool_id = self.tool_id
@@ -130,10 +160,11 @@ class BaseTool(ABC):
             return result
             
         except ToolError as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             self.status = ToolStatus.ERROR
             
-            result = ToolResult(
+            # Fields are produced here, not by callers: skip validation
+            result = ToolResult.model_construct(
                 success=False,
                 error=str(e),
                 execution_time=execution_time,
@@ -146,10 +177,10 @@ class BaseTool(ABC):
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             self.status = ToolStatus.ERROR
             
-            result = ToolResult(
+            result = ToolResult.model_construct(
                 success=False,
                 error=f"Unexpected error: {str(e)}",
                 execution_time=execution_time,
@@ -160,6 +191,21 @@ class BaseTool(ABC):
             logger.error(f"Tool {self.name} unexpected error: {e}", exc_info=True)
             return result
     
+    def get_capability_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Return the tool's capabilities as plain dicts.
+
+        Serialized once per instance and reused; tools whose capabilities
+        change after construction must call invalidate_capabilities_cache().
+        """
+        if self._capability_dicts is None:
+            self._capability_dicts = [cap.model_dump() for cap in self.get_capabilities()]
+        return list(self._capability_dicts)
+
+    def invalidate_capabilities_cache(self):
+        """Drop the cached capability dicts after capabilities change"""
+        self._capability_dicts = None
+
     def get_status(self) -> Dict[str, Any]:
         """Get current tool status and metrics"""
         return {
@@ -171,7 +217,7 @@ class BaseTool(ABC):
             "created_at": self.created_at,
             "last_used": self.last_used,
             "usage_count": self.usage_count,
-            "capabilities": [cap.dict() for cap in self.get_capabilities()]
+            "capabilities": self.get_capability_dicts()
         }
     
     def reset_status(self):
@@ -5,18 +5,121 @@ Provides comprehensive file system operations for the AI agent.
 Inspired by II-Agent's file handling capabilities but designed for our system.
 """
 
+import asyncio
+import concurrent.futures
+import errno
+import functools
+import hashlib
+import itertools
 import os
 import shutil
 import pathlib
-from typing import Dict, Any, List, Optional
+from stat import S_ISDIR, S_ISREG
+from typing import Dict, Any, AsyncIterator, Callable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar, Union
 import aiofiles
-import json
-import yaml
+from aiofiles import os as aio_os
 from .base import BaseTool, ToolResult, ToolCapability, ToolError
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_ALLOWED_EXTENSIONS = (
+    '.txt', '.md', '.json', '.yaml', '.yml', '.py', '.js', '.ts',
+    '.html', '.css', '.xml', '.csv', '.log'
+)
+
+# Threads for blocking filesystem calls, shared by every FileOperationsTool
+MAX_WORKERS = 8
+
+# Characters per chunk for read_file_stream
+STREAM_CHUNK_SIZE = 64 * 1024
+# Entries per batch for list_directory_stream
+LIST_BATCH_SIZE = 1000
+
+# Algorithms accepted by checksum_files; SHAKE digests need an explicit length
+CHECKSUM_ALGORITHMS = frozenset(
+    name for name in hashlib.algorithms_available if not name.startswith("shake_")
+)
+
+
+class DirectoryEntry(NamedTuple):
+    """One directory listing entry, stored as a tuple rather than a dict"""
+    name: str
+    path: str
+    type: str
+    size: Optional[int]
+    level: int
+
+
+# Created on first use; close_file_executor() shuts it down on app shutdown
+_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the thread pool for blocking filesystem work"""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="file_operations"
+        )
+    return _EXECUTOR
+
+
+async def close_file_executor() -> None:
+    """Shut down the file operations thread pool; called on application shutdown"""
+    global _EXECUTOR
+    executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        # Lets queued work finish without blocking the event loop
+        await asyncio.to_thread(executor.shutdown)
+
+
+def _file_digest(path: pathlib.Path, algorithm: str) -> str:
+    """Hex digest of a file; hashlib releases the GIL while hashing large buffers"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, algorithm).hexdigest()
+
+
+# errno values meaning copy_file_range can't be used for this pair of files
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset({errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL})
+
+
+def _copy_file_data(source: Union[str, pathlib.Path], destination: Union[str, pathlib.Path]) -> Union[str, pathlib.Path]:
+    """
+    Copy a file like shutil.copy2, letting the kernel copy the data with
+    os.copy_file_range where available (no userland buffer, reflinks on
+    CoW filesystems). Falls back to shutil.copy2, which itself uses
+    sendfile on Linux, across filesystems or on older kernels.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return shutil.copy2(source, destination)
+
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+
+    # Opening the destination truncates it, which would empty the source too
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as e:
+        if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+            raise
+        return shutil.copy2(source, destination)
+
+    shutil.copystat(source, destination)
+    return destination
+
 
 class FileOperationsTool(BaseTool):
     """
@@ -25,6 +128,120 @@ class FileOperationsTool(BaseTool):
     Provides safe file operations with proper error handling and validation.
     """
 
+    # Capabilities don't depend on the instance: build them once per class
+    _CAPABILITIES = (
+        ToolCapability(
+            name="read_file",
+            description="Read contents of a file",
+            parameters={
+                "required": ["file_path"],
+                "optional": ["encoding"],
+                "file_path": "Path to the file to read",
+                "encoding": "File encoding (default: utf-8)"
+            },
+            examples=["read_file('/path/to/file.txt')", "read_file('config.json')"],
+            category="read"
+        ),
+        ToolCapability(
+            name="write_file",
+            description="Write content to a file",
+            parameters={
+                "required": ["file_path", "content"],
+                "optional": ["encoding", "create_dirs"],
+                "file_path": "Path to the file to write",
+                "content": "Content to write to the file",
+                "encoding": "File encoding (default: utf-8)",
+                "create_dirs": "Create parent directories if they don't exist"
+            },
+            examples=["write_file('/path/to/file.txt', 'Hello World')"],
+            category="write"
+        ),
+        ToolCapability(
+            name="list_directory",
+            description="List contents of a directory",
+            parameters={
+                "required": ["directory_path"],
+                "optional": ["recursive", "include_hidden"],
+                "directory_path": "Path to the directory to list",
+                "recursive": "List subdirectories recursively",
+                "include_hidden": "Include hidden files and directories"
+            },
+            examples=["list_directory('/path/to/dir')", "list_directory('.', recursive=True)"],
+            category="directory"
+        ),
+        ToolCapability(
+            name="create_directory",
+            description="Create a new directory",
+            parameters={
+                "required": ["directory_path"],
+                "optional": ["parents"],
+                "directory_path": "Path to the directory to create",
+                "parents": "Create parent directories if they don't exist"
+            },
+            examples=["create_directory('/path/to/new/dir')"],
+            category="directory"
+        ),
+        ToolCapability(
+            name="delete_file",
+            description="Delete a file",
+            parameters={
+                "required": ["file_path"],
+                "file_path": "Path to the file to delete"
+            },
+            examples=["delete_file('/path/to/file.txt')"],
+            category="delete"
+        ),
+        ToolCapability(
+            name="copy_file",
+            description="Copy a file to another location",
+            parameters={
+                "required": ["source_path", "destination_path"],
+                "optional": ["overwrite"],
+                "source_path": "Path to the source file",
+                "destination_path": "Path to the destination",
+                "overwrite": "Overwrite destination if it exists"
+            },
+            examples=["copy_file('/source/file.txt', '/dest/file.txt')"],
+            category="copy"
+        ),
+        ToolCapability(
+            name="move_file",
+            description="Move a file to another location",
+            parameters={
+                "required": ["source_path", "destination_path"],
+                "optional": ["overwrite"],
+                "source_path": "Path to the source file",
+                "destination_path": "Path to the destination",
+                "overwrite": "Overwrite destination if it exists"
+            },
+            examples=["move_file('/source/file.txt', '/dest/file.txt')"],
+            category="move"
+        ),
+        ToolCapability(
+            name="get_file_info",
+            description="Get information about a file or directory",
+            parameters={
+                "required": ["path"],
+                "path": "Path to the file or directory"
+            },
+            examples=["get_file_info('/path/to/file.txt')"],
+            category="info"
+        ),
+        ToolCapability(
+            name="checksum_files",
+            description="Compute checksums of one or more files",
+            parameters={
+                "required": ["file_paths"],
+                "optional": ["algorithm"],
+                "file_paths": "List of paths to the files to checksum",
+                "algorithm": "hashlib algorithm name (default: sha256)"
+            },
+            examples=["checksum_files(['/path/to/a.txt', '/path/to/b.txt'])"],
+            category="info"
+        )
+    )
+    _CAPABILITIES_BY_NAME = {capability.name: capability for capability in _CAPABILITIES}
+
     def __init__(self, base_path: str = ".", allowed_extensions: Optional[List[str]] = None):
         super().__init__(
             name="file_operations",
@@ -32,175 +249,141 @@ class FileOperationsTool(BaseTool):
             category="file_system"
         )
         self.base_path = pathlib.Path(base_path).resolve()
-        self.allowed_extensions = allowed_extensions or [
-            '.txt', '.md', '.json', '.yaml', '.yml', '.py', '.js', '.ts',
-            '.html', '.css', '.xml', '.csv', '.log'
-        ]
+        # Lower-cased once here so each check is one suffix.lower() and a set lookup
+        self.allowed_extensions = frozenset(
+            ext.lower() for ext in (allowed_extensions or DEFAULT_ALLOWED_EXTENSIONS)
+        )
 
     def get_capabilities(self) -> List[ToolCapability]:
-        return [
-            ToolCapability(
-                name="read_file",
-                description="Read contents of a file",
-                parameters={
-                    "required": ["file_path"],
-                    "optional": ["encoding"],
-                    "file_path": "Path to the file to read",
-                    "encoding": "File encoding (default: utf-8)"
-                },
-                examples=["read_file('/path/to/file.txt')", "read_file('config.json')"],
-                category="read"
-            ),
-            ToolCapability(
-                name="write_file",
-                description="Write content to a file",
-                parameters={
-                    "required": ["file_path", "content"],
-                    "optional": ["encoding", "create_dirs"],
-                    "file_path": "Path to the file to write",
-                    "content": "Content to write to the file",
-                    "encoding": "File encoding (default: utf-8)",
-                    "create_dirs": "Create parent directories if they don't exist"
-                },
-                examples=["write_file('/path/to/file.txt', 'Hello World')"],
-                category="write"
-            ),
-            ToolCapability(
-                name="list_directory",
-                description="List contents of a directory",
-                parameters={
-                    "required": ["directory_path"],
-                    "optional": ["recursive", "include_hidden"],
-                    "directory_path": "Path to the directory to list",
-                    "recursive": "List subdirectories recursively",
-                    "include_hidden": "Include hidden files and directories"
-                },
-                examples=["list_directory('/path/to/dir')", "list_directory('.', recursive=True)"],
-                category="directory"
-            ),
-            ToolCapability(
-                name="create_directory",
-                description="Create a new directory",
-                parameters={
-                    "required": ["directory_path"],
-                    "optional": ["parents"],
-                    "directory_path": "Path to the directory to create",
-                    "parents": "Create parent directories if they don't exist"
-                },
-                examples=["create_directory('/path/to/new/dir')"],
-                category="directory"
-            ),
-            ToolCapability(
-                name="delete_file",
-                description="Delete a file",
-                parameters={
-                    "required": ["file_path"],
-                    "file_path": "Path to the file to delete"
-                },
-                examples=["delete_file('/path/to/file.txt')"],
-                category="delete"
-            ),
-            ToolCapability(
-                name="copy_file",
-                description="Copy a file to another location",
-                parameters={
-                    "required": ["source_path", "destination_path"],
-                    "optional": ["overwrite"],
-                    "source_path": "Path to the source file",
-                    "destination_path": "Path to the destination",
-                    "overwrite": "Overwrite destination if it exists"
-                },
-                examples=["copy_file('/source/file.txt', '/dest/file.txt')"],
-                category="copy"
-            ),
-            ToolCapability(
-                name="move_file",
-                description="Move a file to another location",
-                parameters={
-                    "required": ["source_path", "destination_path"],
-                    "optional": ["overwrite"],
-                    "source_path": "Path to the source file",
-                    "destination_path": "Path to the destination",
-                    "overwrite": "Overwrite destination if it exists"
-                },
-                examples=["move_file('/source/file.txt', '/dest/file.txt')"],
-                category="move"
-            ),
-            ToolCapability(
-                name="get_file_info",
-                description="Get information about a file or directory",
-                parameters={
-                    "required": ["path"],
-                    "path": "Path to the file or directory"
-                },
-                examples=["get_file_info('/path/to/file.txt')"],
-                category="info"
-            )
-        ]
+        return list(self._CAPABILITIES)
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking filesystem call on the shared file operations pool,
+        so a slow rmtree or copy can't stall the event loop or exhaust the
+        loop's default executor
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
 
     def _validate_path(self, path: str) -> pathlib.Path:
         """Validate and resolve a file path"""
         try:
+            # Resolved on every call: symlinks may have changed since the last one
             resolved_path = pathlib.Path(path).resolve()
-
-            # Security check: ensure path is within base_path
-            if not str(resolved_path).startswith(str(self.base_path)):
-                raise ToolError(
-                    f"Path {path} is outside allowed base path {self.base_path}",
-                    tool_name=self.name
-                )
-
-            return resolved_path
         except Exception as e:
             raise ToolError(f"Invalid path {path}: {str(e)}", tool_name=self.name)
 
+        # Security check: ensure path is within base_path. Compares path
+        # components, so /base-other does not pass for base /base
+        if not resolved_path.is_relative_to(self.base_path):
+            raise ToolError(
+                f"Path {path} is outside allowed base path {self.base_path}",
+                tool_name=self.name
+            )
+
+        return resolved_path
+
     def _validate_file_extension(self, path: pathlib.Path):
         """Validate file extension"""
         if self.allowed_extensions and path.suffix.lower() not in self.allowed_extensions:
             raise ToolError(
-                f"File extension {path.suffix} not allowed. Allowed: {self.allowed_extensions}",
+                f"File extension {path.suffix} not allowed. Allowed: {sorted(self.allowed_extensions)}",
                 tool_name=self.name
             )
 
     async def execute(self, action: str, parameters: Dict[str, Any]) -> ToolResult:
         """Execute file operation"""
-        try:
-            if action == "read_file":
-                return await self._read_file(parameters)
-            elif action == "write_file":
-                return await self._write_file(parameters)
-            elif action == "list_directory":
-                return await self._list_directory(parameters)
-            elif action == "create_directory":
-                return await self._create_directory(parameters)
-            elif action == "delete_file":
-                return await self._delete_file(parameters)
-            elif action == "copy_file":
-                return await self._copy_file(parameters)
-            elif action == "move_file":
-                return await self._move_file(parameters)
-            elif action == "get_file_info":
-                return await self._get_file_info(parameters)
-            else:
-                raise ToolError(f"Unknown action: {action}", tool_name=self.name)
+        handler = self._DISPATCH.get(action)
+        if handler is None:
+            raise ToolError(f"Unknown action: {action}", tool_name=self.name)
 
+        try:
+            return await handler(self, parameters)
         except ToolError:
             raise
         except Exception as e:
             raise ToolError(f"File operation failed: {str(e)}", tool_name=self.name)
 
-    async def _read_file(self, parameters: Dict[str, Any]) -> ToolResult:
-        """Read file contents"""
-        file_path = self._validate_path(parameters["file_path"])
-        encoding = parameters.get("encoding", "utf-8")
+    @staticmethod
+    async def _stat(path: pathlib.Path) -> Optional[os.stat_result]:
+        """stat() a path off the event loop; None if it does not exist"""
+        try:
+            return await aio_os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    async def _readable_file(self, path: str) -> Tuple[pathlib.Path, os.stat_result]:
+        """Validate a path for reading: inside base_path, an existing file, allowed extension"""
+        file_path = self._validate_path(path)
+        file_stat = await self._stat(file_path)
 
-        if not file_path.exists():
+        if file_stat is None:
             raise ToolError(f"File {file_path} does not exist", tool_name=self.name)
 
-        if not file_path.is_file():
+        if not S_ISREG(file_stat.st_mode):
             raise ToolError(f"Path {file_path} is not a file", tool_name=self.name)
 
         self._validate_file_extension(file_path)
+        return file_path, file_stat
+
+    async def _listable_directory(self, path: str) -> pathlib.Path:
+        """Validate a path for listing: inside base_path and an existing directory"""
+        dir_path = self._validate_path(path)
+        dir_stat = await self._stat(dir_path)
+
+        if dir_stat is None:
+            raise ToolError(f"Directory {dir_path} does not exist", tool_name=self.name)
+
+        if not S_ISDIR(dir_stat.st_mode):
+            raise ToolError(f"Path {dir_path} is not a directory", tool_name=self.name)
+
+        return dir_path
+
+    async def read_file_stream(
+        self,
+        file_path: str,
+        encoding: str = "utf-8",
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[str]:
+        """
+        Yield a file's text in chunks of up to chunk_size characters.
+
+        Streaming counterpart of the read_file action for files too large to
+        return in a single ToolResult; applies the same path checks.
+        """
+        path, _ = await self._readable_file(file_path)
+        async with aiofiles.open(path, 'r', encoding=encoding) as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+
+    async def list_directory_stream(
+        self,
+        directory_path: str,
+        recursive: bool = False,
+        include_hidden: bool = False,
+        batch_size: int = LIST_BATCH_SIZE
+    ) -> AsyncIterator[List[DirectoryEntry]]:
+        """
+        Yield directory entries in batches of up to batch_size items.
+
+        Streaming counterpart of the list_directory action, in the same order.
+        Entries are compact DirectoryEntry tuples; call _asdict() on one for
+        the dict shape list_directory returns. Each batch is read in a worker
+        thread.
+        """
+        dir_path = await self._listable_directory(directory_path)
+        walker = self._walk_directory(dir_path, recursive, include_hidden)
+        try:
+            while batch := await self._run_blocking(list, itertools.islice(walker, batch_size)):
+                yield batch
+        finally:
+            walker.close()
+
+    async def _read_file(self, parameters: Dict[str, Any]) -> ToolResult:
+        """Read file contents"""
+        file_path, file_stat = await self._readable_file(parameters["file_path"])
+        encoding = parameters.get("encoding", "utf-8")
 
         async with aiofiles.open(file_path, 'r', encoding=encoding) as f:
             content = await f.read()
@@ -210,7 +393,7 @@ class FileOperationsTool(BaseTool):
             data={
                 "content": content,
                 "file_path": str(file_path),
-                "size": file_path.stat().st_size,
+                "size": file_stat.st_size,
                 "encoding": encoding
             },
             message=f"Successfully read file {file_path}"
@@ -226,17 +409,20 @@ class FileOperationsTool(BaseTool):
         self._validate_file_extension(file_path)
 
         # Create parent directories if needed
-        if create_dirs and not file_path.parent.exists():
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        if create_dirs and await self._stat(file_path.parent) is None:
+            await self._run_blocking(file_path.parent.mkdir, parents=True, exist_ok=True)
 
         async with aiofiles.open(file_path, 'w', encoding=encoding) as f:
             await f.write(content)
 
+        # Size on disk, without encoding a second copy of the content
+        written = await aio_os.stat(file_path)
+
         return ToolResult(
             success=True,
             data={
                 "file_path": str(file_path),
-                "size": len(content.encode(encoding)),
+                "size": written.st_size,
                 "encoding": encoding
             },
             message=f"Successfully wrote to file {file_path}"
@@ -244,39 +430,13 @@ class FileOperationsTool(BaseTool):
 
     async def _list_directory(self, parameters: Dict[str, Any]) -> ToolResult:
         """List directory contents"""
-        dir_path = self._validate_path(parameters["directory_path"])
+        dir_path = await self._listable_directory(parameters["directory_path"])
         recursive = parameters.get("recursive", False)
         include_hidden = parameters.get("include_hidden", False)
 
-        if not dir_path.exists():
-            raise ToolError(f"Directory {dir_path} does not exist", tool_name=self.name)
-
-        if not dir_path.is_dir():
-            raise ToolError(f"Path {dir_path} is not a directory", tool_name=self.name)
-
-        items = []
-
-        def scan_directory(path: pathlib.Path, level: int = 0):
-            try:
-                for item in path.iterdir():
-                    if not include_hidden and item.name.startswith('.'):
-                        continue
-
-                    item_info = {
-                        "name": item.name,
-                        "path": str(item),
-                        "type": "directory" if item.is_dir() else "file",
-                        "size": item.stat().st_size if item.is_file() else None,
-                        "level": level
-                    }
-                    items.append(item_info)
-
-                    if recursive and item.is_dir() and level < 10:  # Limit recursion depth
-                        scan_directory(item, level + 1)
-            except PermissionError:
-                logger.warning(f"Permission denied accessing {path}")
-
-        scan_directory(dir_path)
+        # DirectoryEntry tuples are only expanded into dicts for the result
+        entries = await self._run_blocking(list, self._walk_directory(dir_path, recursive, include_hidden))
+        items = [entry._asdict() for entry in entries]
 
         return ToolResult(
             success=True,
@@ -288,19 +448,65 @@ class FileOperationsTool(BaseTool):
             message=f"Successfully listed directory {dir_path}"
         )
 
+    def _walk_directory(self, dir_path: pathlib.Path, recursive: bool, include_hidden: bool) -> Iterator[DirectoryEntry]:
+        """
+        Yield directory entries depth-first, each directory's contents right
+        after the directory itself, down to 10 levels.
+
+        Uses an explicit stack of open scandir iterators instead of recursion.
+        DirEntry caches the file type from the directory read, so only files
+        need a stat() call (for their size).
+        """
+        stack = []
+        try:
+            self._push_scandir(stack, str(dir_path), 0)
+            while stack:
+                entries, level = stack[-1]
+                entry = next(entries, None)
+                if entry is None:
+                    entries.close()
+                    stack.pop()
+                    continue
+
+                if not include_hidden and entry.name.startswith('.'):
+                    continue
+
+                is_dir = entry.is_dir()
+                yield DirectoryEntry(
+                    entry.name,
+                    entry.path,
+                    "directory" if is_dir else "file",
+                    entry.stat().st_size if not is_dir and entry.is_file() else None,
+                    level
+                )
+
+                if recursive and is_dir and level < 10:  # Limit recursion depth
+                    self._push_scandir(stack, entry.path, level + 1)
+        finally:
+            for entries, _ in stack:
+                entries.close()
+
+    @staticmethod
+    def _push_scandir(stack: List[Any], path: str, level: int):
+        """Open a directory for _walk_directory, skipping unreadable ones"""
+        try:
+            stack.append((os.scandir(path), level))
+        except PermissionError:
+            logger.warning(f"Permission denied accessing {path}")
+
     async def _create_directory(self, parameters: Dict[str, Any]) -> ToolResult:
         """Create directory"""
         dir_path = self._validate_path(parameters["directory_path"])
         parents = parameters.get("parents", True)
 
-        if dir_path.exists():
+        if await self._stat(dir_path) is not None:
             return ToolResult(
                 success=True,
                 data={"directory": str(dir_path)},
                 message=f"Directory {dir_path} already exists"
             )
 
-        dir_path.mkdir(parents=parents, exist_ok=True)
+        await self._run_blocking(dir_path.mkdir, parents=parents, exist_ok=True)
 
         return ToolResult(
             success=True,
@@ -312,13 +518,14 @@ class FileOperationsTool(BaseTool):
         """Delete file"""
         file_path = self._validate_path(parameters["file_path"])
 
-        if not file_path.exists():
+        file_stat = await self._stat(file_path)
+        if file_stat is None:
             raise ToolError(f"File {file_path} does not exist", tool_name=self.name)
 
-        if file_path.is_file():
-            file_path.unlink()
-        elif file_path.is_dir():
-            shutil.rmtree(file_path)
+        if S_ISREG(file_stat.st_mode):
+            await self._run_blocking(file_path.unlink)
+        elif S_ISDIR(file_stat.st_mode):
+            await self._run_blocking(shutil.rmtree, file_path)
 
         return ToolResult(
             success=True,
@@ -332,16 +539,24 @@ class FileOperationsTool(BaseTool):
         dest_path = self._validate_path(parameters["destination_path"])
         overwrite = parameters.get("overwrite", False)
 
-        if not source_path.exists():
+        source_stat = await self._stat(source_path)
+        if source_stat is None:
             raise ToolError(f"Source file {source_path} does not exist", tool_name=self.name)
 
-        if dest_path.exists() and not overwrite:
-            raise ToolError(f"Destination {dest_path} exists and overwrite is False", tool_name=self.name)
-
-        if source_path.is_file():
-            shutil.copy2(source_path, dest_path)
-        elif source_path.is_dir():
-            shutil.copytree(source_path, dest_path, dirs_exist_ok=overwrite)
+        dest_stat = await self._stat(dest_path)
+        if dest_stat is not None:
+            if not overwrite:
+                raise ToolError(f"Destination {dest_path} exists and overwrite is False", tool_name=self.name)
+            if (dest_stat.st_dev, dest_stat.st_ino) == (source_stat.st_dev, source_stat.st_ino):
+                raise ToolError(f"Source and destination {dest_path} are the same file", tool_name=self.name)
+
+        if S_ISREG(source_stat.st_mode):
+            await self._run_blocking(_copy_file_data, source_path, dest_path)
+        elif S_ISDIR(source_stat.st_mode):
+            await self._run_blocking(
+                shutil.copytree, source_path, dest_path,
+                copy_function=_copy_file_data, dirs_exist_ok=overwrite
+            )
 
         return ToolResult(
             success=True,
@@ -358,13 +573,13 @@ class FileOperationsTool(BaseTool):
         dest_path = self._validate_path(parameters["destination_path"])
         overwrite = parameters.get("overwrite", False)
 
-        if not source_path.exists():
+        if await self._stat(source_path) is None:
             raise ToolError(f"Source file {source_path} does not exist", tool_name=self.name)
 
-        if dest_path.exists() and not overwrite:
+        if not overwrite and await self._stat(dest_path) is not None:
             raise ToolError(f"Destination {dest_path} exists and overwrite is False", tool_name=self.name)
 
-        shutil.move(str(source_path), str(dest_path))
+        await self._run_blocking(shutil.move, str(source_path), str(dest_path))
 
         return ToolResult(
             success=True,
@@ -379,14 +594,14 @@ class FileOperationsTool(BaseTool):
         """Get file information"""
         path = self._validate_path(parameters["path"])
 
-        if not path.exists():
+        stat = await self._stat(path)
+        if stat is None:
             raise ToolError(f"Path {path} does not exist", tool_name=self.name)
 
-        stat = path.stat()
         info = {
             "path": str(path),
             "name": path.name,
-            "type": "directory" if path.is_dir() else "file",
+            "type": "directory" if S_ISDIR(stat.st_mode) else "file",
             "size": stat.st_size,
             "created": stat.st_ctime,
             "modified": stat.st_mtime,
@@ -394,7 +609,7 @@ class FileOperationsTool(BaseTool):
             "permissions": oct(stat.st_mode)[-3:]
         }
 
-        if path.is_file():
+        if S_ISREG(stat.st_mode):
             info["extension"] = path.suffix
 
         return ToolResult(
@@ -402,3 +617,40 @@ class FileOperationsTool(BaseTool):
             data=info,
             message=f"Successfully retrieved info for {path}"
         )
+
+    async def _checksum_files(self, parameters: Dict[str, Any]) -> ToolResult:
+        """Checksum files, hashing them concurrently in worker threads"""
+        algorithm = parameters.get("algorithm", "sha256")
+        if not isinstance(algorithm, str) or algorithm not in CHECKSUM_ALGORITHMS:
+            raise ToolError(f"Unsupported checksum algorithm: {algorithm}", tool_name=self.name)
+
+        paths = parameters["file_paths"]
+        if isinstance(paths, str):
+            paths = [paths]
+
+        file_paths = [(await self._readable_file(path))[0] for path in paths]
+        digests = await asyncio.gather(
+            *(self._run_blocking(_file_digest, file_path, algorithm) for file_path in file_paths)
+        )
+
+        return ToolResult(
+            success=True,
+            data={
+                "algorithm": algorithm,
+                "checksums": {str(file_path): digest for file_path, digest in zip(file_paths, digests)}
+            },
+            message=f"Successfully computed {algorithm} checksums for {len(file_paths)} files"
+        )
+
+    # Action name -> handler; defined after the handlers it references
+    _DISPATCH = {
+        "read_file": _read_file,
+        "write_file": _write_file,
+        "list_directory": _list_directory,
+        "create_directory": _create_directory,
+        "delete_file": _delete_file,
+        "copy_file": _copy_file,
+        "move_file": _move_file,
+        "get_file_info": _get_file_info,
+        "checksum_files": _checksum_files,
+    }
@@ -7,13 +7,51 @@ milestone management, and project analysis.
 
 import json
 import asyncio
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from .base import BaseTool, ToolResult, ToolCapability, ToolError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Last formatted timestamp and the second it was formatted for
+_last_ts_sec = [-1]
+_last_ts_str = [""]
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, formatted at most once per second"""
+    s = int(time.time())
+    if s != _last_ts_sec[0]:
+        _last_ts_sec[0] = s
+        _last_ts_str[0] = datetime.fromtimestamp(s).isoformat()
+    return _last_ts_str[0]
+
+
+# Task fields update_task may change
+_UPDATABLE_FIELDS = ("title", "description", "status", "priority", "due_date", "assignee", "tags")
+
+# Task fields with a secondary index; their values must be hashable
+_INDEXED_FIELDS = ("status", "assignee", "priority", "project_id")
+_UPDATABLE_INDEXED_FIELDS = tuple(f for f in _INDEXED_FIELDS if f in _UPDATABLE_FIELDS)
+
+# Distinct list_tasks filter combinations cached before the cache is reset
+_LIST_CACHE_SIZE = 256
+
+# list_tasks limit when the caller gives none: every matching task
+DEFAULT_LIST_LIMIT = sys.maxsize
+
+
+def _is_hashable(value: Any) -> bool:
+    """Whether value can be an index key; tuples may still hold a list"""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
 
 class ProjectManagementTool(BaseTool):
     """
@@ -22,6 +60,120 @@ class ProjectManagementTool(BaseTool):
     Provides task management, milestone tracking, and project analysis capabilities.
     """
 
+    # Capabilities don't depend on the instance: build them once per class
+    _CAPABILITIES = (
+        ToolCapability(
+            name="create_task",
+            description="Create a new task",
+            parameters={
+                "required": ["title", "description"],
+                "optional": ["priority", "due_date", "assignee", "project_id", "tags"],
+                "title": "Task title",
+                "description": "Task description",
+                "priority": "Task priority (low, medium, high, critical)",
+                "due_date": "Due date in ISO format",
+                "assignee": "Person assigned to the task",
+                "project_id": "ID of the project this task belongs to",
+                "tags": "List of tags for the task"
+            },
+            examples=["create_task('Fix login bug', 'User cannot login with valid credentials')"],
+            category="task"
+        ),
+        ToolCapability(
+            name="update_task",
+            description="Update an existing task",
+            parameters={
+                "required": ["task_id"],
+                "optional": ["title", "description", "status", "priority", "due_date", "assignee", "tags"],
+                "task_id": "ID of the task to update",
+                "status": "Task status (todo, in_progress, review, done, cancelled)"
+            },
+            examples=["update_task('task_123', status='in_progress')"],
+            category="task"
+        ),
+        ToolCapability(
+            name="get_task",
+            description="Get details of a specific task",
+            parameters={
+                "required": ["task_id"],
+                "task_id": "ID of the task to retrieve"
+            },
+            examples=["get_task('task_123')"],
+            category="task"
+        ),
+        ToolCapability(
+            name="list_tasks",
+            description="List tasks with optional filtering",
+            parameters={
+                "optional": ["project_id", "status", "assignee", "priority", "tags", "limit", "offset", "include_filters_applied"],
+                "project_id": "Filter by project ID",
+                "status": "Filter by task status",
+                "assignee": "Filter by assignee",
+                "priority": "Filter by priority",
+                "tags": "Filter by tags",
+                "limit": "Maximum number of tasks to return (default: all matching tasks)",
+                "offset": "Number of matching tasks to skip; page with next_offset",
+                "include_filters_applied": "Echo the given parameters back in filters_applied"
+            },
+            examples=["list_tasks(status='in_progress')", "list_tasks(assignee='john')"],
+            category="task"
+        ),
+        ToolCapability(
+            name="bulk_tasks",
+            description="Create and update many tasks in one call",
+            parameters={
+                "optional": ["creates", "updates"],
+                "creates": "List of create_task parameter dicts",
+                "updates": "List of update_task parameter dicts, each with a task_id"
+            },
+            examples=["bulk_tasks(creates=[{'title': 'Write docs', 'description': 'API reference'}])"],
+            category="task"
+        ),
+        ToolCapability(
+            name="create_milestone",
+            description="Create a project milestone",
+            parameters={
+                "required": ["title", "target_date"],
+                "optional": ["description", "project_id", "tasks"],
+                "title": "Milestone title",
+                "target_date": "Target completion date in ISO format",
+                "description": "Milestone description",
+                "project_id": "ID of the project this milestone belongs to",
+                "tasks": "List of task IDs associated with this milestone"
+            },
+            examples=["create_milestone('Beta Release', '2024-12-31')"],
+            category="milestone"
+        ),
+        ToolCapability(
+            name="analyze_project",
+            description="Analyze project progress and metrics",
+            parameters={
+                "required": ["project_id"],
+                "optional": ["include_tasks", "include_milestones"],
+                "project_id": "ID of the project to analyze",
+                "include_tasks": "Include detailed task analysis",
+                "include_milestones": "Include milestone analysis"
+            },
+            examples=["analyze_project('proj_123')"],
+            category="analysis"
+        ),
+        ToolCapability(
+            name="generate_report",
+            description="Generate project status report",
+            parameters={
+                "required": ["report_type"],
+                "optional": ["project_id", "date_range", "format"],
+                "report_type": "Type of report (summary, detailed, timeline)",
+                "project_id": "Specific project to report on",
+                "date_range": "Date range for the report",
+                "format": "Report format (json, markdown, html)"
+            },
+            examples=["generate_report('summary')", "generate_report('detailed', project_id='proj_123')"],
+            category="reporting"
+        )
+    )
+    _CAPABILITIES_BY_NAME = {capability.name: capability for capability in _CAPABILITIES}
+
     def __init__(self):
         super().__init__(
             name="project_management",
@@ -32,134 +184,80 @@ class ProjectManagementTool(BaseTool):
         self.tasks = {}
         self.milestones = {}
         self.projects = {}
+        # Last task number handed out; never reused, unlike len(self.tasks)
+        self._task_seq = 0
+
+        # list_tasks results by (write generation, filters); see _list_tasks
+        self._list_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._list_cache_gen = 0
+
+        # Secondary indexes for list_tasks: field value -> integer ids of
+        # matching tasks. Integer ids hash to themselves and are assigned in
+        # creation order, so sorting them restores task order.
+        self._by_status: Dict[str, Set[int]] = {}
+        self._by_assignee: Dict[str, Set[int]] = {}
+        self._by_priority: Dict[str, Set[int]] = {}
+        self._by_project: Dict[str, Set[int]] = {}
+        self._by_tag: Dict[str, Set[int]] = {}
+        self._int_ids: Dict[str, int] = {}
+        self._id_to_task: List[Dict[str, Any]] = []
+        # (index, key) pairs each task is filed under, by integer id. Tasks
+        # are handed out in results, so unindexing must not trust their
+        # current field values
+        self._indexed_keys: Dict[int, List[Tuple[Dict[Any, Set[int]], Any]]] = {}
 
     def get_capabilities(self) -> List[ToolCapability]:
-        return [
-            ToolCapability(
-                name="create_task",
-                description="Create a new task",
-                parameters={
-                    "required": ["title", "description"],
-                    "optional": ["priority", "due_date", "assignee", "project_id", "tags"],
-                    "title": "Task title",
-                    "description": "Task description",
-                    "priority": "Task priority (low, medium, high, critical)",
-                    "due_date": "Due date in ISO format",
-                    "assignee": "Person assigned to the task",
-                    "project_id": "ID of the project this task belongs to",
-                    "tags": "List of tags for the task"
-                },
-                examples=["create_task('Fix login bug', 'User cannot login with valid credentials')"],
-                category="task"
-            ),
-            ToolCapability(
-                name="update_task",
-                description="Update an existing task",
-                parameters={
-                    "required": ["task_id"],
-                    "optional": ["title", "description", "status", "priority", "due_date", "assignee", "tags"],
-                    "task_id": "ID of the task to update",
-                    "status": "Task status (todo, in_progress, review, done, cancelled)"
-                },
-                examples=["update_task('task_123', status='in_progress')"],
-                category="task"
-            ),
-            ToolCapability(
-                name="get_task",
-                description="Get details of a specific task",
-                parameters={
-                    "required": ["task_id"],
-                    "task_id": "ID of the task to retrieve"
-                },
-                examples=["get_task('task_123')"],
-                category="task"
-            ),
-            ToolCapability(
-                name="list_tasks",
-                description="List tasks with optional filtering",
-                parameters={
-                    "optional": ["project_id", "status", "assignee", "priority", "tags"],
-                    "project_id": "Filter by project ID",
-                    "status": "Filter by task status",
-                    "assignee": "Filter by assignee",
-                    "priority": "Filter by priority",
-                    "tags": "Filter by tags"
-                },
-                examples=["list_tasks(status='in_progress')", "list_tasks(assignee='john')"],
-                category="task"
-            ),
-            ToolCapability(
-                name="create_milestone",
-                description="Create a project milestone",
-                parameters={
-                    "required": ["title", "target_date"],
-                    "optional": ["description", "project_id", "tasks"],
-                    "title": "Milestone title",
-                    "target_date": "Target completion date in ISO format",
-                    "description": "Milestone description",
-                    "project_id": "ID of the project this milestone belongs to",
-                    "tasks": "List of task IDs associated with this milestone"
-                },
-                examples=["create_milestone('Beta Release', '2024-12-31')"],
-                category="milestone"
-            ),
-            ToolCapability(
-                name="analyze_project",
-                description="Analyze project progress and metrics",
-                parameters={
-                    "required": ["project_id"],
-                    "optional": ["include_tasks", "include_milestones"],
-                    "project_id": "ID of the project to analyze",
-                    "include_tasks": "Include detailed task analysis",
-                    "include_milestones": "Include milestone analysis"
-                },
-                examples=["analyze_project('proj_123')"],
-                category="analysis"
-            ),
-            ToolCapability(
-                name="generate_report",
-                description="Generate project status report",
-                parameters={
-                    "required": ["report_type"],
-                    "optional": ["project_id", "date_range", "format"],
-                    "report_type": "Type of report (summary, detailed, timeline)",
-                    "project_id": "Specific project to report on",
-                    "date_range": "Date range for the report",
-                    "format": "Report format (json, markdown, html)"
-                },
-                examples=["generate_report('summary')", "generate_report('detailed', project_id='proj_123')"],
-                category="reporting"
-            )
-        ]
+        return list(self._CAPABILITIES)
 
     async def execute(self, action: str, parameters: Dict[str, Any]) -> ToolResult:
         """Execute project management action"""
-        try:
-            if action == "create_task":
-                return await self._create_task(parameters)
-            elif action == "update_task":
-                return await self._update_task(parameters)
-            elif action == "get_task":
-                return await self._get_task(parameters)
-            elif action == "list_tasks":
-                return await self._list_tasks(parameters)
-            elif action == "create_milestone":
-                return await self._create_milestone(parameters)
-            elif action == "analyze_project":
-                return await self._analyze_project(parameters)
-            elif action == "generate_report":
-                return await self._generate_report(parameters)
-            else:
-                raise ToolError(f"Unknown action: {action}", tool_name=self.name)
+        handler = self._DISPATCH.get(action)
+        if handler is None:
+            # Caller mistakes are reported as failed results, not raised
+            return ToolResult(success=False, error=f"Unknown action: {action}", tool_name=self.name)
 
+        try:
+            return await handler(self, parameters)
         except ToolError:
             raise
         except Exception as e:
             raise ToolError(f"Project management operation failed: {str(e)}", tool_name=self.name)
 
-    async def _create_task(self, parameters: Dict[str, Any]) -> ToolResult:
-        """Create a new task"""
-        task_id = f"task_{len(self.tasks) + 1}"
+    def _task_not_found(self, task_id: str) -> ToolResult:
+        """Failed result for a lookup of a task that doesn't exist"""
+        return ToolResult(success=False, error=f"Task {task_id} not found", tool_name=self.name)
+
+    def _normalize_tags(self, tags: Any) -> List[Any]:
+        """Task tags as a new list of hashable values; a single string is one tag"""
+        if tags is None:
+            return []
+        if isinstance(tags, str):
+            return [tags]
+        if not isinstance(tags, (list, tuple, set, frozenset)):
+            raise ToolError(f"tags must be a list, got {type(tags).__name__}", tool_name=self.name)
+        for tag in tags:
+            if not _is_hashable(tag):
+                raise ToolError(f"tags must be hashable values, got {type(tag).__name__}", tool_name=self.name)
+        return list(tags)
+
+    def _check_indexed_fields(self, fields: Dict[str, Any], names=_INDEXED_FIELDS) -> None:
+        """Raise ToolError if an indexed field in fields can't be an index key"""
+        for field in names:
+            value = fields.get(field)
+            if not _is_hashable(value):
+                raise ToolError(
+                    f"{field} must be a hashable value, got {type(value).__name__}", tool_name=self.name
+                )
+
+    def _add_task(self, parameters: Dict[str, Any], now: str) -> Dict[str, Any]:
+        """Build a task from create_task parameters and store and index it"""
+        # Validate before touching any structure, so a bad value can't leave
+        # a task stored but only partly indexed
+        self._check_indexed_fields(parameters)
+        tags = self._normalize_tags(parameters.get("tags"))
+
+        self._task_seq += 1
+        task_id = f"task_{self._task_seq}"
 
         task = {
             "id": task_id,
@@ -170,35 +268,51 @@ class ProjectManagementTool(BaseTool):
             "due_date": parameters.get("due_date"),
             "assignee": parameters.get("assignee"),
             "project_id": parameters.get("project_id"),
-            "tags": parameters.get("tags", []),
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "tags": tags,
+            "created_at": now,
+            "updated_at": now
         }
 
         self.tasks[task_id] = task
+        self._int_ids[task_id] = len(self._id_to_task)
+        self._id_to_task.append(task)
+        self._index_task(task)
+        self._list_cache_gen += 1
+        return task
+
+    def _apply_update(self, task: Dict[str, Any], fields: Dict[str, Any], now: str) -> None:
+        """Apply update_task fields to a task, moving it between index buckets"""
+        self._check_indexed_fields(fields, _UPDATABLE_INDEXED_FIELDS)
+        if "tags" in fields:
+            fields = {**fields, "tags": self._normalize_tags(fields["tags"])}
+
+        self._unindex_task(task)
+        for field in _UPDATABLE_FIELDS:
+            if field in fields:
+                task[field] = fields[field]
+        self._index_task(task)
+        task["updated_at"] = now
+        self._list_cache_gen += 1
+
+    async def _create_task(self, parameters: Dict[str, Any]) -> ToolResult:
+        """Create a new task"""
+        task = self._add_task(parameters, _now_iso())
 
         return ToolResult(
             success=True,
             data={"task": task},
-            message=f"Successfully created task {task_id}: {task['title']}"
+            message=f"Successfully created task {task['id']}: {task['title']}"
         )
 
     async def _update_task(self, parameters: Dict[str, Any]) -> ToolResult:
         """Update an existing task"""
         task_id = parameters["task_id"]
 
-        if task_id not in self.tasks:
-            raise ToolError(f"Task {task_id} not found", tool_name=self.name)
-
-        task = self.tasks[task_id]
+        task = self.tasks.get(task_id)
+        if task is None:
+            return self._task_not_found(task_id)
 
-        # Update fields if provided
-        updatable_fields = ["title", "description", "status", "priority", "due_date", "assignee", "tags"]
-        for field in updatable_fields:
-            if field in parameters:
-                task[field] = parameters[field]
-
-        task["updated_at"] = datetime.now().isoformat()
+        self._apply_update(task, parameters, _now_iso())
 
         return ToolResult(
             success=True,
@@ -206,14 +320,70 @@ class ProjectManagementTool(BaseTool):
             message=f"Successfully updated task {task_id}"
         )
 
+    async def _bulk_tasks(self, parameters: Dict[str, Any]) -> ToolResult:
+        """Create and update tasks in one pass, sharing one timestamp"""
+        creates = parameters.get("creates") or []
+        updates = parameters.get("updates") or []
+        if not isinstance(creates, (list, tuple)) or not isinstance(updates, (list, tuple)):
+            return ToolResult(success=False, error="creates and updates must be lists", tool_name=self.name)
+        created: List[str] = []
+        updated: List[str] = []
+        errors: List[Dict[str, Any]] = []
+
+        if not creates and not updates:
+            return ToolResult(
+                success=True,
+                data={"created": created, "updated": updated, "errors": errors},
+                message="No tasks to create or update"
+            )
+
+        now = _now_iso()
+
+        # Bad entries are reported and skipped; one of them must not abort
+        # the batch after earlier entries have been applied
+        for index, fields in enumerate(creates):
+            if not isinstance(fields, dict):
+                errors.append({"create": index, "error": "entry must be an object"})
+                continue
+            if "title" not in fields or "description" not in fields:
+                errors.append({"create": index, "error": "title and description are required"})
+                continue
+            try:
+                created.append(self._add_task(fields, now)["id"])
+            except ToolError as e:
+                errors.append({"create": index, "error": str(e)})
+
+        tasks = self.tasks
+        for index, fields in enumerate(updates):
+            if not isinstance(fields, dict):
+                errors.append({"update": index, "error": "entry must be an object"})
+                continue
+            task_id = fields.get("task_id")
+            task = tasks.get(task_id) if _is_hashable(task_id) else None
+            if task is None:
+                errors.append({"update": index, "task_id": task_id, "error": f"Task {task_id} not found"})
+                continue
+            try:
+                self._apply_update(task, fields, now)
+            except ToolError as e:
+                errors.append({"update": index, "task_id": task_id, "error": str(e)})
+                continue
+            updated.append(task_id)
+
+        return ToolResult(
+            success=True,
+            data={"created": created, "updated": updated, "errors": errors},
+            message=f"Created {len(created)} and updated {len(updated)} tasks"
+                    + (f" with {len(errors)} errors" if errors else "")
+        )
+
     async def _get_task(self, parameters: Dict[str, Any]) -> ToolResult:
         """Get task details"""
         task_id = parameters["task_id"]
 
-        if task_id not in self.tasks:
-            raise ToolError(f"Task {task_id} not found", tool_name=self.name)
-
-        task = self.tasks[task_id]
+        task = self.tasks.get(task_id)
+        if task is None:
+            return self._task_not_found(task_id)
 
         return ToolResult(
             success=True,
@@ -221,33 +391,137 @@ class ProjectManagementTool(BaseTool):
             message=f"Successfully retrieved task {task_id}"
         )
 
+    def _task_indexes(self, task: Dict[str, Any]):
+        """Yield (index, key) pairs under which a task is indexed"""
+        yield self._by_status, task.get("status")
+        yield self._by_assignee, task.get("assignee")
+        yield self._by_priority, task.get("priority")
+        yield self._by_project, task.get("project_id")
+        for tag in task.get("tags") or ():
+            yield self._by_tag, tag
+
+    def _index_task(self, task: Dict[str, Any]) -> None:
+        """Add a task to the secondary indexes"""
+        int_id = self._int_ids[task["id"]]
+        keys = list(self._task_indexes(task))
+        for index, key in keys:
+            index.setdefault(key, set()).add(int_id)
+        self._indexed_keys[int_id] = keys
+
+    def _unindex_task(self, task: Dict[str, Any]) -> None:
+        """Remove a task from the buckets it was filed under"""
+        int_id = self._int_ids[task["id"]]
+        for index, key in self._indexed_keys.pop(int_id, ()):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.discard(int_id)
+                if not bucket:
+                    del index[key]
+
+    def _filter_tasks(self, project_id, status, assignee, priority, tags) -> List[Dict[str, Any]]:
+        """Tasks matching every given filter, in creation order"""
+        candidates: Optional[Set[int]] = None
+
+        # Intersect the index buckets of every filter given
+        for value, index in (
+            (project_id, self._by_project),
+            (status, self._by_status),
+            (assignee, self._by_assignee),
+            (priority, self._by_priority),
+        ):
+            if value:
+                bucket = index.get(value, set())
+                candidates = bucket if candidates is None else candidates & bucket
+
+        # Tasks match the tags filter if they carry any of the given tags
+        if tags:
+            by_tag = self._by_tag
+            tagged = set().union(*(by_tag.get(tag, ()) for tag in tags))
+            candidates = tagged if candidates is None else candidates & tagged
+
+        if candidates is None:
+            return list(self.tasks.values())
+        id_to_task = self._id_to_task
+        return [id_to_task[int_id] for int_id in sorted(candidates)]
+
+    @staticmethod
+    def _page_param(parameters: Dict[str, Any], name: str, default: int) -> Optional[int]:
+        """A list_tasks paging parameter as an int; None if it isn't a non-negative integer"""
+        value = parameters.get(name)
+        if value is None:
+            return default
+        if isinstance(value, bool):
+            return None
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        return value if value >= 0 else None
+
     async def _list_tasks(self, parameters: Dict[str, Any]) -> ToolResult:
         """List tasks with filtering"""
-        filtered_tasks = []
+        limit = self._page_param(parameters, "limit", DEFAULT_LIST_LIMIT)
+        offset = self._page_param(parameters, "offset", 0)
+        if limit is None or offset is None:
+            return ToolResult(
+                success=False,
+                error="limit and offset must be non-negative integers",
+                tool_name=self.name
+            )
 
-        for task in self.tasks.values():
-            # Apply filters
-            if parameters.get("project_id") and task.get("project_id") != parameters["project_id"]:
-                continue
-            if parameters.get("status") and task.get("status") != parameters["status"]:
-                continue
-            if parameters.get("assignee") and task.get("assignee") != parameters["assignee"]:
-                continue
-            if parameters.get("priority") and task.get("priority") != parameters["priority"]:
-                continue
-            if parameters.get("tags"):
-                task_tags = task.get("tags", [])
-                if not any(tag in task_tags for tag in parameters["tags"]):
-                    continue
+        tags = parameters.get("tags")
+        try:
+            # Filter values become index and cache keys, so they follow the
+            # same rules as task values; a set keys the cache in any order
+            self._check_indexed_fields(parameters)
+            if tags:
+                tags = frozenset(self._normalize_tags(tags))
+        except ToolError as e:
+            return ToolResult(success=False, error=str(e), tool_name=self.name)
+        filters = (
+            parameters.get("project_id") or None,
+            parameters.get("status") or None,
+            parameters.get("assignee") or None,
+            parameters.get("priority") or None,
+            tags or None,
+        )
+
+        # Any task write bumps the generation, so stale entries never match
+        key = (self._list_cache_gen, filters)
+        filtered_tasks = self._list_cache.get(key)
+        if filtered_tasks is None:
+            if len(self._list_cache) >= _LIST_CACHE_SIZE:
+                self._list_cache.clear()
+            filtered_tasks = self._filter_tasks(*filters)
+            self._list_cache[key] = filtered_tasks
+        # Slicing gives callers their own list; the cached one must not change
+        total_count = len(filtered_tasks)
+        page = filtered_tasks[offset:offset + limit]
+        next_offset = offset + limit if offset + limit < total_count else None
 
-            filtered_tasks.append(task)
+        # The parameter echo is only built for callers that ask for it
+        filters_applied = (
+            {k: v for k, v in parameters.items() if v is not None}
+            if parameters.get("include_filters_applied") else {}
+        )
 
         return ToolResult(
             success=True,
             data={
-                "tasks": filtered_tasks,
-                "total_count": len(filtered_tasks),
-                "filters_applied": {k: v for k, v in parameters.items() if v is not None}
+                "tasks": page,
+                "total_count": total_count,
+                "next_offset": next_offset,
+                "filters_applied": filters_applied
             },
-            message=f"Successfully retrieved {len(filtered_tasks)} tasks"
+            message=f"Successfully retrieved {len(page)} of {total_count} tasks"
         )
+
+    # Action name -> handler; milestone, analysis and reporting capabilities
+    # are advertised but have no handler yet
+    _DISPATCH = {
+        "create_task": _create_task,
+        "update_task": _update_task,
+        "get_task": _get_task,
+        "list_tasks": _list_tasks,
+        "bulk_tasks": _bulk_tasks,
+    }
@@ -5,8 +5,9 @@ Central registry for managing all available tools in the system.
 Provides discovery, registration, and execution coordination.
 """
 
-from typing import Dict, List, Optional, Type, Any
+from typing import Callable, Dict, List, Optional, Set, Type, Any
 from .base import BaseTool, ToolResult, ToolError
+import importlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,12 +19,22 @@ class ToolRegistry:
     
     Manages tool registration, discovery, and execution coordination.
     Inspired by II-Agent's tool management but adapted for our system.
+    
+    The lookup dicts are never mutated in place: writers build a new dict
+    and swap the reference in, so readers can iterate whatever dict they
+    picked up without locks or defensive copies.
     """
     
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
-        self._categories: Dict[str, List[str]] = {}
+        self._categories: Dict[str, Set[str]] = {}
         self._tool_classes: Dict[str, Type[BaseTool]] = {}
+        # Lowercased "name\0description" per tool, built once for search_tools
+        self._search_blob: Dict[str, str] = {}
+        # Tools registered by factory; built and promoted into _tools on first use
+        self._lazy_factories: Dict[str, Callable[[], BaseTool]] = {}
+        # get_categories result; reset only when a category appears or goes away
+        self._category_names: Optional[List[str]] = None
     
     def register_tool(self, tool: BaseTool) -> bool:
         """Register a tool instance"""
@@ -31,14 +42,20 @@ class ToolRegistry:
             if tool.name in self._tools:
                 logger.warning(f"Tool {tool.name} already registered, replacing...")
             
-            self._tools[tool.name] = tool
+            # Capabilities are static; serialize them now rather than per request
+            tool.get_capability_dicts()
             
-            # Update category mapping
-            if tool.category not in self._categories:
-                self._categories[tool.category] = []
+            tools = dict(self._tools)
+            tools[tool.name] = tool
+            self._tools = tools
             
-            if tool.name not in self._categories[tool.category]:
-                self._categories[tool.category].append(tool.name)
+            # NUL separator keeps a query from matching across name and description
+            search_blob = dict(self._search_blob)
+            search_blob[tool.name] = f"{tool.name}\0{tool.description}".lower()
+            self._search_blob = search_blob
+            
+            # Update category mapping
+            self._add_to_category(tool.category, tool.name)
             
             logger.info(f"Registered tool: {tool.name} (category: {tool.category})")
             return True
@@ -56,34 +73,108 @@ class ToolRegistry:
             logger.error(f"Failed to register tool class {tool_class.__name__}: {e}")
             return False
     
+    def register_lazy(self, name: str, factory: Callable[[], BaseTool], category: str = "general") -> None:
+        """
+        Register a tool to be built on first use.
+        
+        The factory is called, and the tool registered normally, the first
+        time the tool is looked up. Until then it only shows in its category.
+        """
+        factories = dict(self._lazy_factories)
+        factories[name] = factory
+        self._lazy_factories = factories
+        self._add_to_category(category, name)
+    
+    def _add_to_category(self, category: str, name: str) -> None:
+        categories = dict(self._categories)
+        if category not in categories:
+            self._category_names = None
+        categories[category] = categories.get(category, set()) | {name}
+        self._categories = categories
+    
+    def _remove_from_category(self, category: str, name: str) -> None:
+        if name not in self._categories.get(category, ()):
+            return
+        categories = dict(self._categories)
+        remaining = categories[category] - {name}
+        if remaining:
+            categories[category] = remaining
+        else:
+            del categories[category]
+            self._category_names = None
+        self._categories = categories
+    
+    def _load_lazy(self, name: str) -> Optional[BaseTool]:
+        """Build a lazily registered tool and promote it into the registry"""
+        factory = self._lazy_factories.get(name)
+        if factory is None:
+            return self._tools.get(name)
+        
+        factories = dict(self._lazy_factories)
+        del factories[name]
+        self._lazy_factories = factories
+        
+        # The tool re-adds itself under its own category when registered
+        for category, names in self._categories.items():
+            if name in names:
+                self._remove_from_category(category, name)
+                break
+        
+        try:
+            tool = factory()
+        except Exception as e:
+            logger.error(f"Failed to build tool {name}: {e}")
+            return None
+        
+        self.register_tool(tool)
+        return self._tools.get(name)
+    
+    def _load_all_lazy(self) -> None:
+        for name in list(self._lazy_factories):
+            self._load_lazy(name)
+    
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name"""
-        return self._tools.get(name)
+        tool = self._tools.get(name)
+        if tool is None and name in self._lazy_factories:
+            tool = self._load_lazy(name)
+        return tool
     
     def get_tools_by_category(self, category: str) -> List[BaseTool]:
         """Get all tools in a specific category"""
-        tool_names = self._categories.get(category, [])
-        return [self._tools[name] for name in tool_names if name in self._tools]
+        tool_names = self._categories.get(category, ())
+        if not self._lazy_factories.keys().isdisjoint(tool_names):
+            for name in tool_names:
+                self.get_tool(name)
+            tool_names = self._categories.get(category, ())
+        tools = self._tools
+        return [tools[name] for name in tool_names if name in tools]
     
     def get_all_tools(self) -> Dict[str, BaseTool]:
-        """Get all registered tools"""
-        return self._tools.copy()
+        """Get all registered tools; the returned dict is shared and must not be modified"""
+        if self._lazy_factories:
+            self._load_all_lazy()
+        return self._tools
     
     def get_categories(self) -> List[str]:
-        """Get all available categories"""
-        return list(self._categories.keys())
+        """Get all available categories; the returned list is shared and must not be modified"""
+        if self._category_names is None:
+            self._category_names = list(self._categories)
+        return self._category_names
     
     def search_tools(self, query: str) -> List[BaseTool]:
         """Search tools by name or description"""
         query_lower = query.lower()
-        matching_tools = []
-        
-        for tool in self._tools.values():
-            if (query_lower in tool.name.lower() or 
-                query_lower in tool.description.lower()):
-                matching_tools.append(tool)
-        
-        return matching_tools
+        # Descriptions are only known once a tool is built
+        if self._lazy_factories:
+            self._load_all_lazy()
+        search_blob = self._search_blob
+        tools = self._tools
+        # The two snapshots can straddle an unregister; skip names already gone
+        return [
+            tool for name, blob in search_blob.items()
+            if query_lower in blob and (tool := tools.get(name)) is not None
+        ]
     
     def get_tool_capabilities(self, tool_name: Optional[str] = None) -> Dict[str, Any]:
         """Get capabilities for a specific tool or all tools"""
@@ -92,22 +183,32 @@ class ToolRegistry:
             if tool:
                 return {
                     "tool": tool.name,
-                    "capabilities": [cap.dict() for cap in tool.get_capabilities()]
+                    "capabilities": tool.get_capability_dicts()
                 }
             else:
                 return {"error": f"Tool {tool_name} not found"}
         
         # Return all tool capabilities
+        if self._lazy_factories:
+            self._load_all_lazy()
         all_capabilities = {}
         for name, tool in self._tools.items():
             all_capabilities[name] = {
                 "description": tool.description,
                 "category": tool.category,
-                "capabilities": [cap.dict() for cap in tool.get_capabilities()]
+                "capabilities": tool.get_capability_dicts()
             }
         
         return all_capabilities
     
+    def invalidate_capabilities(self, tool_name: str) -> bool:
+        """Re-serialize a tool's capabilities on next request after they change"""
+        tool = self.get_tool(tool_name)
+        if not tool:
+            return False
+        tool.invalidate_capabilities_cache()
+        return True
+    
     async def execute_tool(self, tool_name: str, action: str, parameters: Dict[str, Any]) -> ToolResult:
         """Execute a tool action"""
         tool = self.get_tool(tool_name)
@@ -127,30 +228,41 @@ class ToolRegistry:
             tool_statuses[name] = tool.get_status()
         
         return {
-            "total_tools": len(self._tools),
-            "categories": self._categories,
-            "tools": tool_statuses
+            "total_tools": len(self._tools) + len(self._lazy_factories),
+            "categories": {category: sorted(names) for category, names in self._categories.items()},
+            "tools": tool_statuses,
+            "pending_tools": sorted(self._lazy_factories)
         }
     
     def unregister_tool(self, name: str) -> bool:
         """Unregister a tool"""
-        if name in self._tools:
-            tool = self._tools[name]
-            del self._tools[name]
-            
-            # Remove from category
-            if tool.category in self._categories:
-                if name in self._categories[tool.category]:
-                    self._categories[tool.category].remove(name)
-                
-                # Remove empty categories
-                if not self._categories[tool.category]:
-                    del self._categories[tool.category]
-            
+        if name in self._lazy_factories:
+            factories = dict(self._lazy_factories)
+            del factories[name]
+            self._lazy_factories = factories
+            for category, names in self._categories.items():
+                if name in names:
+                    self._remove_from_category(category, name)
+                    break
             logger.info(f"Unregistered tool: {name}")
             return True
         
-        return False
+        tool = self._tools.get(name)
+        if tool is None:
+            return False
+        
+        search_blob = dict(self._search_blob)
+        search_blob.pop(name, None)
+        self._search_blob = search_blob
+        
+        tools = dict(self._tools)
+        del tools[name]
+        self._tools = tools
+        
+        self._remove_from_category(tool.category, name)
+        
+        logger.info(f"Unregistered tool: {name}")
+        return True
 
 
 # Global registry instance
@@ -166,25 +278,23 @@ def get_tool_registry() -> ToolRegistry:
     return _global_registry
 
 
+def _lazy_tool(module: str, class_name: str) -> Callable[[], BaseTool]:
+    """Factory that imports a tool module and instantiates the tool on first use"""
+    def factory() -> BaseTool:
+        return getattr(importlib.import_module(module, __package__), class_name)()
+    return factory
+
+
 def _initialize_default_tools():
     """Initialize default tools in the registry"""
     registry = _global_registry
     
-    try:
-        # Import and register default tools
-        from .file_operations import FileOperationsTool
-        from .project_management import ProjectManagementTool
-        from .web_operations import WebOperationsTool
-        
-        # Register tools
-        registry.register_tool_class(FileOperationsTool)
-        registry.register_tool_class(ProjectManagementTool)
-        registry.register_tool_class(WebOperationsTool)
-        
-        logger.info("Default tools initialized successfully")
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize default tools: {e}")
+    # Register factories; each tool is only built when first looked up
+    registry.register_lazy("file_operations", _lazy_tool(".file_operations", "FileOperationsTool"), "file_system")
+    registry.register_lazy("project_management", _lazy_tool(".project_management", "ProjectManagementTool"), "project_management")
+    registry.register_lazy("web_operations", _lazy_tool(".web_operations", "WebOperationsTool"), "web")
+    
+    logger.info("Default tools registered")
 
 
 def reset_registry():
@@ -5,15 +5,391 @@ Provides advanced web operations including API calls, web scraping,
 and external service integrations.
 """
 
+import aiofiles
 import aiohttp
 import asyncio
-from typing import Dict, Any, List, Optional
-from urllib.parse import urljoin, urlparse
+import contextlib
+import os
+import re
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict, Any, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit
 from .base import BaseTool, ToolResult, ToolCapability, ToolError
 import logging
 
+try:
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+except ImportError:  # fall back to regex extraction
+    LexborHTMLParser = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # fall back to aiohttp's stdlib json decoding
+    orjson = None  # type: ignore
+
+try:
+    import aiodns  # type: ignore  # noqa: F401
+except ImportError:  # aiohttp's threaded resolver is used instead
+    aiodns = None  # type: ignore
+
+try:
+    import brotli  # type: ignore  # noqa: F401
+except ImportError:
+    try:
+        import brotlicffi as brotli  # type: ignore  # noqa: F401
+    except ImportError:  # aiohttp can't decode br, so don't ask for it
+        brotli = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Default read size for download_file; matches aiohttp's stream buffer
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Limits on what fetch_webpage reads and returns
+MAX_HTML_BYTES = 4 * 1024 * 1024
+HTML_CHUNK_SIZE = 64 * 1024
+MAX_TEXT_CHARS = 5000
+# Pages larger than this are parsed on a worker thread, off the event loop
+INLINE_EXTRACT_CHARS = 64 * 1024
+MAX_LINKS = 50
+MAX_IMAGES = 20
+
+_ABSOLUTE_URL_PREFIXES = ('http://', 'https://')
+
+# Encodings aiohttp decompresses transparently while streaming the body
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli is not None else 'gzip, deflate'
+
+# HEAD responses from origins that may still answer a GET; check_url_status
+# then probes with a one-byte ranged GET
+HEAD_REJECTED_STATUSES = frozenset({403, 405, 501})
+_PROBE_RANGE_HEADERS = {'Range': 'bytes=0-0'}
+
+# Response headers reported by default; include_all_headers returns them all
+DEFAULT_RESPONSE_HEADERS = ('content-type', 'content-length', 'etag', 'last-modified', 'cache-control')
+
+# Regex fallback when selectolax is not installed
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+# One scan finds both link targets (href) and image sources (src)
+_URL_ATTR_RE = re.compile(r'\b(href|src)=[\'"]?([^\'" >]+)', re.IGNORECASE)
+
+
+# Session shared by every WebOperationsTool, so all of them draw on one
+# connection pool and DNS cache. Created on first use in the running loop.
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+# Suspended generator that closes _SESSION when its loop shuts down
+_SESSION_GUARD: Optional[AsyncIterator[None]] = None
+
+
+async def _close_on_loop_shutdown(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+    """Close the session when the generator is finalized"""
+    try:
+        yield
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+def _close_with_loop(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+    """
+    Arrange for the session to be closed before its loop is.
+
+    asyncio.run() and the test runners call loop.shutdown_asyncgens() before
+    closing a loop, which finalizes every async generator started on it. The
+    returned generator must stay referenced until then, or it is finalized
+    early and closes the session while it is still in use.
+    """
+    guard = _close_on_loop_shutdown(session)
+    asyncio.ensure_future(guard.__anext__())
+    return guard
+
+
+def _retire_session(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a still-open session that belongs to another event loop"""
+    if loop.is_running():
+        # A loop in another thread: close the session there
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        # Its loop stopped without shutting down its async generators; its
+        # connections can't be closed gracefully any more, so close what can
+        # be from here rather than leaving the session open
+        task = asyncio.ensure_future(session.close())
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it for the running loop if needed"""
+    global _SESSION, _SESSION_LOOP, _SESSION_GUARD
+    loop = asyncio.get_running_loop()
+    # No await between the check and the assignment, so concurrent callers
+    # on the loop can't both create a session
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        if _SESSION is not None and not _SESSION.closed:
+            _retire_session(_SESSION, _SESSION_LOOP)
+        connector = aiohttp.TCPConnector(
+            limit=1000,
+            limit_per_host=30,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=75,
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None
+        )
+        _SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={
+                'User-Agent': 'AI-Agent-Assistant/1.0',
+                'Accept-Encoding': ACCEPT_ENCODING
+            }
+        )
+        _SESSION_LOOP = loop
+        _SESSION_GUARD = _close_with_loop(_SESSION)
+    return _SESSION
+
+
+# Cap on web operations in flight at once across all tools, so a burst of
+# calls queues here instead of exhausting sockets and timing out in bulk
+MAX_CONCURRENCY = int(os.getenv('WEB_OPS_MAX_CONCURRENCY', '256'))
+
+_GATE: Optional[asyncio.BoundedSemaphore] = None
+_GATE_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_gate() -> asyncio.BoundedSemaphore:
+    """Return the concurrency gate for the running loop"""
+    global _GATE, _GATE_LOOP
+    loop = asyncio.get_running_loop()
+    if _GATE is None or _GATE_LOOP is not loop:
+        _GATE = asyncio.BoundedSemaphore(MAX_CONCURRENCY)
+        _GATE_LOOP = loop
+    return _GATE
+
+
+async def close_shared_session() -> None:
+    """Close the shared session; called on application shutdown"""
+    global _SESSION, _SESSION_LOOP, _SESSION_GUARD
+    session, _SESSION, _SESSION_LOOP, _SESSION_GUARD = _SESSION, None, None, None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+# Conditional GET cache: the validators of each cached response and the body
+# they describe. Re-fetches send If-None-Match/If-Modified-Since and reuse the
+# body on 304 Not Modified. Bounded by entry count and by the total size of
+# the cached bodies; larger bodies are not cached at all.
+CONDITIONAL_CACHE_SIZE = 512
+CONDITIONAL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+CONDITIONAL_CACHE_MAX_ENTRY_BYTES = 1024 * 1024
+
+_CONDITIONAL_HEADERS = frozenset({'if-none-match', 'if-modified-since'})
+
+
+class _CachedResponse(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    status: int
+    headers: Any  # case-insensitive CIMultiDict copy of the response headers
+    content_type: str
+    body: Any
+    url: str
+    size: int  # body size in bytes as received
+    truncated: bool
+
+
+_conditional_cache: "OrderedDict[Tuple, _CachedResponse]" = OrderedDict()
+_conditional_cache_bytes = 0
+
+
+def _cache_key(kind: str, url: str, params: Optional[Dict[str, Any]] = None,
+               headers: Optional[Dict[str, Any]] = None) -> Optional[Tuple]:
+    """Cache key for a GET, or None if the caller sent its own validators"""
+    headers = headers or {}
+    if any(str(name).lower() in _CONDITIONAL_HEADERS for name in headers):
+        return None
+    return (
+        kind,
+        url,
+        tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+        tuple(sorted((str(k).lower(), str(v)) for k, v in headers.items()))
+    )
+
+
+def _lookup_cached(key: Optional[Tuple]) -> Optional[_CachedResponse]:
+    if key is None:
+        return None
+    cached = _conditional_cache.get(key)
+    if cached is not None:
+        _conditional_cache.move_to_end(key)
+    return cached
+
+
+def _with_validators(headers: Optional[Dict[str, Any]], cached: _CachedResponse) -> Dict[str, Any]:
+    """Request headers plus the conditional headers for a cached response"""
+    conditional = dict(headers or {})
+    if cached.etag:
+        conditional['If-None-Match'] = cached.etag
+    if cached.last_modified:
+        conditional['If-Modified-Since'] = cached.last_modified
+    return conditional
+
+
+def _discard_cached(key: Tuple) -> None:
+    global _conditional_cache_bytes
+    cached = _conditional_cache.pop(key, None)
+    if cached is not None:
+        _conditional_cache_bytes -= cached.size
+
+
+def _store_cached(key: Optional[Tuple], response: aiohttp.ClientResponse, body: Any,
+                  size: int, truncated: bool = False) -> None:
+    """Remember a 200 response that carries validators and may be stored"""
+    global _conditional_cache_bytes
+    if key is None or response.status != 200:
+        return
+    # Whatever was cached under this key describes an older response
+    _discard_cached(key)
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not (etag or last_modified) or 'no-store' in response.headers.get('Cache-Control', '').lower():
+        return
+    if size > CONDITIONAL_CACHE_MAX_ENTRY_BYTES:
+        return
+    _conditional_cache[key] = _CachedResponse(
+        etag=etag,
+        last_modified=last_modified,
+        status=response.status,
+        headers=response.headers.copy(),
+        content_type=response.headers.get('content-type', ''),
+        body=body,
+        url=str(response.url),
+        size=size,
+        truncated=truncated
+    )
+    _conditional_cache_bytes += size
+    while (len(_conditional_cache) > CONDITIONAL_CACHE_SIZE
+           or _conditional_cache_bytes > CONDITIONAL_CACHE_MAX_BYTES):
+        _, evicted = _conditional_cache.popitem(last=False)
+        _conditional_cache_bytes -= evicted.size
+
+
+def _extract_headers(headers: Any, keys: Tuple[str, ...] = DEFAULT_RESPONSE_HEADERS) -> Dict[str, str]:
+    """Pick the given headers out of a case-insensitive header multidict"""
+    picked = {}
+    for key in keys:
+        value = headers.get(key)
+        if value is not None:
+            picked[key] = value
+    return picked
+
+
+def _response_headers(headers: Any, include_all: bool) -> Dict[str, str]:
+    """Headers for a result payload: all of them only when asked for"""
+    return dict(headers) if include_all else _extract_headers(headers)
+
+
+def _url_status_data(url: str, response: aiohttp.ClientResponse, include_all_headers: bool) -> Dict[str, Any]:
+    """Result payload for a URL status probe"""
+    content_length = response.headers.get('content-length')
+    if response.status == 206:
+        # Content-Length covers the probed byte; the full size follows the '/'
+        content_range = response.headers.get('content-range', '')
+        total = content_range.rpartition('/')[2]
+        content_length = total if total.isdigit() else None
+    return {
+        "url": url,
+        "status_code": response.status,
+        "final_url": str(response.url),
+        "headers": _response_headers(response.headers, include_all_headers),
+        "is_accessible": response.status < 400,
+        "content_type": response.headers.get('content-type', ''),
+        "content_length": content_length
+    }
+
+
+def _url_resolver(base_url: str) -> Callable[[str], str]:
+    """
+    Return a function resolving links found on base_url.
+
+    The base is parsed once. Plain relative, root-relative and
+    protocol-relative links are joined by concatenation; anything urljoin
+    would have to normalise (dot segments, queries, fragments, other
+    schemes) still goes through urljoin.
+    """
+    base = urlsplit(base_url)
+    if base.scheme not in ('http', 'https') or not base.netloc:
+        return lambda link: link if link.startswith(_ABSOLUTE_URL_PREFIXES) else urljoin(base_url, link)
+
+    scheme = base.scheme + ':'
+    root = f'{scheme}//{base.netloc}'
+    directory = root + base.path.rsplit('/', 1)[0] + '/'
+
+    def resolve(link: str) -> str:
+        if link.startswith(_ABSOLUTE_URL_PREFIXES):
+            return link
+        if link.startswith(('.', '?', '#')) or '/.' in link or ':' in link.split('/', 1)[0]:
+            return urljoin(base_url, link)
+        if link.startswith('//'):
+            return scheme + link
+        if link.startswith('/'):
+            return root + link
+        return directory + link
+
+    return resolve
+
+
+def _extract_page(
+    html: str,
+    url: str,
+    extract_text: bool,
+    extract_links: bool,
+    extract_images: bool
+) -> Dict[str, Any]:
+    """
+    Extract text, links and images from a page.
+
+    Uses a single selectolax parse when available; otherwise falls back to
+    regex scans over the raw HTML.
+    """
+    result: Dict[str, Any] = {}
+    absolute_url = _url_resolver(url)
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        if extract_text:
+            root = tree.body or tree.root
+            text = root.text(separator=' ', strip=True) if root is not None else ''
+            result["text_content"] = ' '.join(text.split())[:MAX_TEXT_CHARS]
+        if extract_links:
+            links = [node.attributes.get('href') for node in tree.css('a[href]')]
+            result["links"] = [absolute_url(link) for link in links if link][:MAX_LINKS]
+        if extract_images:
+            images = [node.attributes.get('src') for node in tree.css('img[src]')]
+            result["images"] = [absolute_url(img) for img in images if img][:MAX_IMAGES]
+        return result
+
+    if extract_text:
+        text_content = _WHITESPACE_RE.sub(' ', _TAG_RE.sub('', html)).strip()
+        result["text_content"] = text_content[:MAX_TEXT_CHARS]
+    if extract_links or extract_images:
+        links: List[str] = []
+        images: List[str] = []
+        max_links = MAX_LINKS if extract_links else 0
+        max_images = MAX_IMAGES if extract_images else 0
+        for match in _URL_ATTR_RE.finditer(html):
+            if match.group(1).lower() == 'href':
+                if len(links) < max_links:
+                    links.append(absolute_url(match.group(2)))
+            elif len(images) < max_images:
+                images.append(absolute_url(match.group(2)))
+            if len(links) >= max_links and len(images) >= max_images:
+                break
+        if extract_links:
+            result["links"] = links
+        if extract_images:
+            result["images"] = images
+    return result
+
 
 class WebOperationsTool(BaseTool):
     """
@@ -22,98 +398,97 @@ class WebOperationsTool(BaseTool):
     Provides HTTP requests, API calls, and web data extraction capabilities.
     """
     
+    # Capabilities don't depend on the instance: build them once per class
+    _CAPABILITIES = (
+        ToolCapability(
+            name="http_request",
+            description="Make HTTP requests to web APIs",
+            parameters={
+                "required": ["url", "method"],
+                "optional": ["headers", "data", "params", "timeout", "include_all_headers"],
+                "url": "Target URL for the request",
+                "method": "HTTP method (GET, POST, PUT, DELETE, etc.)",
+                "headers": "Request headers as dictionary",
+                "data": "Request body data",
+                "params": "URL parameters as dictionary",
+                "timeout": "Request timeout in seconds",
+                "include_all_headers": "Return every response header instead of the common subset"
+            },
+            examples=["http_request('https://api.example.com/data', 'GET')"],
+            category="http"
+        ),
+        ToolCapability(
+            name="fetch_webpage",
+            description="Fetch and extract content from a webpage",
+            parameters={
+                "required": ["url"],
+                "optional": ["extract_text", "extract_links", "extract_images"],
+                "url": "URL of the webpage to fetch",
+                "extract_text": "Extract text content from the page",
+                "extract_links": "Extract all links from the page",
+                "extract_images": "Extract image URLs from the page"
+            },
+            examples=["fetch_webpage('https://example.com', extract_text=True)"],
+            category="scraping"
+        ),
+        ToolCapability(
+            name="check_url_status",
+            description="Check the status and availability of a URL",
+            parameters={
+                "required": ["url"],
+                "optional": ["follow_redirects", "include_all_headers"],
+                "url": "URL to check",
+                "follow_redirects": "Whether to follow redirects",
+                "include_all_headers": "Return every response header instead of the common subset"
+            },
+            examples=["check_url_status('https://example.com')"],
+            category="monitoring"
+        ),
+        ToolCapability(
+            name="download_file",
+            description="Download a file from a URL",
+            parameters={
+                "required": ["url", "destination"],
+                "optional": ["chunk_size", "max_size"],
+                "url": "URL of the file to download",
+                "destination": "Local path to save the file",
+                "chunk_size": f"Download chunk size in bytes (default {DOWNLOAD_CHUNK_SIZE})",
+                "max_size": "Maximum file size to download in bytes"
+            },
+            examples=["download_file('https://example.com/file.pdf', './downloads/file.pdf')"],
+            category="download"
+        )
+    )
+    _CAPABILITIES_BY_NAME = {capability.name: capability for capability in _CAPABILITIES}
+    
     def __init__(self):
         super().__init__(
             name="web_operations",
             description="Advanced web operations including HTTP requests, API calls, and data extraction",
             category="web"
         )
-        self.session = None
     
     async def _get_session(self):
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={
-                    'User-Agent': 'AI-Agent-Assistant/1.0'
-                }
-            )
-        return self.session
+        """Get the aiohttp session shared by all web tools"""
+        return _get_shared_session()
     
     def get_capabilities(self) -> List[ToolCapability]:
-        return [
-            ToolCapability(
-                name="http_request",
-                description="Make HTTP requests to web APIs",
-                parameters={
-                    "required": ["url", "method"],
-                    "optional": ["headers", "data", "params", "timeout"],
-                    "url": "Target URL for the request",
-                    "method": "HTTP method (GET, POST, PUT, DELETE, etc.)",
-                    "headers": "Request headers as dictionary",
-                    "data": "Request body data",
-                    "params": "URL parameters as dictionary",
-                    "timeout": "Request timeout in seconds"
-                },
-                examples=["http_request('https://api.example.com/data', 'GET')"],
-                category="http"
-            ),
-            ToolCapability(
-                name="fetch_webpage",
-                description="Fetch and extract content from a webpage",
-                parameters={
-                    "required": ["url"],
-                    "optional": ["extract_text", "extract_links", "extract_images"],
-                    "url": "URL of the webpage to fetch",
-                    "extract_text": "Extract text content from the page",
-                    "extract_links": "Extract all links from the page",
-                    "extract_images": "Extract image URLs from the page"
-                },
-                examples=["fetch_webpage('https://example.com', extract_text=True)"],
-                category="scraping"
-            ),
-            ToolCapability(
-                name="check_url_status",
-                description="Check the status and availability of a URL",
-                parameters={
-                    "required": ["url"],
-                    "optional": ["follow_redirects"],
-                    "url": "URL to check",
-                    "follow_redirects": "Whether to follow redirects"
-                },
-                examples=["check_url_status('https://example.com')"],
-                category="monitoring"
-            ),
-            ToolCapability(
-                name="download_file",
-                description="Download a file from a URL",
-                parameters={
-                    "required": ["url", "destination"],
-                    "optional": ["chunk_size", "max_size"],
-                    "url": "URL of the file to download",
-                    "destination": "Local path to save the file",
-                    "chunk_size": "Download chunk size in bytes",
-                    "max_size": "Maximum file size to download in bytes"
-                },
-                examples=["download_file('https://example.com/file.pdf', './downloads/file.pdf')"],
-                category="download"
-            )
-        ]
+        return list(self._CAPABILITIES)
     
     async def execute(self, action: str, parameters: Dict[str, Any]) -> ToolResult:
         """Execute web operation"""
         try:
-            if action == "http_request":
-                return await self._http_request(parameters)
-            elif action == "fetch_webpage":
-                return await self._fetch_webpage(parameters)
-            elif action == "check_url_status":
-                return await self._check_url_status(parameters)
-            elif action == "download_file":
-                return await self._download_file(parameters)
-            else:
-                raise ToolError(f"Unknown action: {action}", tool_name=self.name)
+            async with _get_gate():
+                if action == "http_request":
+                    return await self._http_request(parameters)
+                elif action == "fetch_webpage":
+                    return await self._fetch_webpage(parameters)
+                elif action == "check_url_status":
+                    return await self._check_url_status(parameters)
+                elif action == "download_file":
+                    return await self._download_file(parameters)
+                else:
+                    raise ToolError(f"Unknown action: {action}", tool_name=self.name)
                 
         except ToolError:
             raise
@@ -128,6 +503,12 @@ class WebOperationsTool(BaseTool):
         data = parameters.get("data")
         params = parameters.get("params", {})
         timeout = parameters.get("timeout", 30)
+        include_all_headers = parameters.get("include_all_headers", False)
+        
+        cache_key = _cache_key("request", url, params, headers) if method == "GET" else None
+        cached = _lookup_cached(cache_key)
+        if cached is not None:
+            headers = _with_validators(headers, cached)
         
         session = await self._get_session()
         
@@ -141,17 +522,39 @@ class WebOperationsTool(BaseTool):
                 timeout=aiohttp.ClientTimeout(total=timeout)
             ) as response:
                 
+                if response.status == 304 and cached is not None:
+                    return ToolResult(
+                        success=True,
+                        data={
+                            "status_code": cached.status,
+                            "headers": _response_headers(cached.headers, include_all_headers),
+                            "content_type": cached.content_type,
+                            "data": cached.body,
+                            "url": cached.url,
+                            "from_cache": True
+                        },
+                        message=f"HTTP {method} request to {url} not modified, served from cache"
+                    )
+                
                 # Get response data
                 content_type = response.headers.get('content-type', '')
+                # Buffered once; json() and text() decode this same buffer
+                body = await response.read()
                 
                 if 'application/json' in content_type:
-                    response_data = await response.json()
+                    if orjson is not None:
+                        # Parse the raw bytes; no intermediate str decode
+                        response_data = orjson.loads(body) if body.strip() else None
+                    else:
+                        response_data = await response.json()
                 else:
                     response_data = await response.text()
                 
+                _store_cached(cache_key, response, response_data, len(body))
+                
                 result_data = {
                     "status_code": response.status,
-                    "headers": dict(response.headers),
+                    "headers": _response_headers(response.headers, include_all_headers),
                     "content_type": content_type,
                     "data": response_data,
                     "url": str(response.url)
@@ -175,54 +578,53 @@ class WebOperationsTool(BaseTool):
         extract_links = parameters.get("extract_links", False)
         extract_images = parameters.get("extract_images", False)
         
+        cache_key = _cache_key("page", url)
+        cached = _lookup_cached(cache_key)
+        headers = _with_validators(None, cached) if cached is not None else None
+        
         session = await self._get_session()
         
         try:
-            async with session.get(url) as response:
+            async with session.get(url, headers=headers) as response:
                 if response.status >= 400:
                     raise ToolError(f"Failed to fetch webpage: HTTP {response.status}", tool_name=self.name)
                 
-                html_content = await response.text()
+                from_cache = response.status == 304 and cached is not None
+                truncated = False
+                if from_cache:
+                    html_content = cached.body
+                    truncated = cached.truncated
+                else:
+                    # Read in chunks and stop at MAX_HTML_BYTES rather than
+                    # buffering however much the server sends
+                    buffer = bytearray()
+                    async for chunk in response.content.iter_chunked(HTML_CHUNK_SIZE):
+                        buffer += chunk
+                        if len(buffer) >= MAX_HTML_BYTES:
+                            truncated = True
+                            break
+                    del buffer[MAX_HTML_BYTES:]
+                    try:
+                        html_content = buffer.decode(response.charset or 'utf-8', errors='replace')
+                    except LookupError:  # unknown charset in Content-Type
+                        html_content = buffer.decode('utf-8', errors='replace')
+                    body_size = len(buffer)
+                    del buffer
+                    _store_cached(cache_key, response, html_content, body_size, truncated)
                 
                 result_data = {
                     "url": url,
-                    "status_code": response.status,
-                    "content_length": len(html_content)
+                    "status_code": cached.status if from_cache else response.status,
+                    "content_length": len(html_content),
+                    "truncated": truncated,
+                    "from_cache": from_cache
                 }
                 
-                # Basic text extraction (would use BeautifulSoup in production)
-                if extract_text:
-                    # Simple text extraction - remove HTML tags
-                    import re
-                    text_content = re.sub(r'<[^>]+>', '', html_content)
-                    text_content = re.sub(r'\s+', ' ', text_content).strip()
-                    result_data["text_content"] = text_content[:5000]  # Limit text length
-                
-                # Basic link extraction
-                if extract_links:
-                    import re
-                    links = re.findall(r'href=[\'"]?([^\'" >]+)', html_content)
-                    # Convert relative URLs to absolute
-                    absolute_links = []
-                    for link in links[:50]:  # Limit number of links
-                        if link.startswith('http'):
-                            absolute_links.append(link)
-                        else:
-                            absolute_links.append(urljoin(url, link))
-                    result_data["links"] = absolute_links
-                
-                # Basic image extraction
-                if extract_images:
-                    import re
-                    images = re.findall(r'src=[\'"]?([^\'" >]+)', html_content)
-                    # Convert relative URLs to absolute
-                    absolute_images = []
-                    for img in images[:20]:  # Limit number of images
-                        if img.startswith('http'):
-                            absolute_images.append(img)
-                        else:
-                            absolute_images.append(urljoin(url, img))
-                    result_data["images"] = absolute_images
+                extract_args = (html_content, url, extract_text, extract_links, extract_images)
+                if len(html_content) > INLINE_EXTRACT_CHARS:
+                    result_data.update(await asyncio.to_thread(_extract_page, *extract_args))
+                else:
+                    result_data.update(_extract_page(*extract_args))
                 
                 return ToolResult(
                     success=True,
@@ -237,27 +639,35 @@ class WebOperationsTool(BaseTool):
         """Check URL status"""
         url = parameters["url"]
         follow_redirects = parameters.get("follow_redirects", True)
+        include_all_headers = parameters.get("include_all_headers", False)
         
         session = await self._get_session()
         
         try:
+            method = "HEAD"
             async with session.head(url, allow_redirects=follow_redirects) as response:
-                result_data = {
-                    "url": url,
-                    "status_code": response.status,
-                    "final_url": str(response.url),
-                    "headers": dict(response.headers),
-                    "is_accessible": response.status < 400,
-                    "content_type": response.headers.get('content-type', ''),
-                    "content_length": response.headers.get('content-length')
-                }
-                
-                return ToolResult(
-                    success=True,
-                    data=result_data,
-                    message=f"URL {url} status check completed: {response.status}"
-                )
-                
+                result_data = _url_status_data(url, response, include_all_headers)
+            
+            if response.status in HEAD_REJECTED_STATUSES:
+                # Some origins refuse HEAD but serve GET; ask for one byte
+                method = "GET"
+                async with session.get(url, headers=_PROBE_RANGE_HEADERS,
+                                       allow_redirects=follow_redirects) as response:
+                    result_data = _url_status_data(url, response, include_all_headers)
+                    if response.status == 206:
+                        # The single byte asked for; the connection stays reusable
+                        await response.read()
+                    else:
+                        # Range ignored: drop the connection rather than read the body
+                        response.close()
+            
+            result_data["method"] = method
+            return ToolResult(
+                success=True,
+                data=result_data,
+                message=f"URL {url} status check completed: {response.status}"
+            )
+            
         except aiohttp.ClientError as e:
             return ToolResult(
                 success=False,
@@ -269,7 +679,7 @@ class WebOperationsTool(BaseTool):
         """Download file from URL"""
         url = parameters["url"]
         destination = parameters["destination"]
-        chunk_size = parameters.get("chunk_size", 8192)
+        chunk_size = parameters.get("chunk_size", DOWNLOAD_CHUNK_SIZE)
         max_size = parameters.get("max_size", 100 * 1024 * 1024)  # 100MB default
         
         session = await self._get_session()
@@ -285,12 +695,36 @@ class WebOperationsTool(BaseTool):
                 
                 downloaded_size = 0
                 
-                with open(destination, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(chunk_size):
-                        downloaded_size += len(chunk)
-                        if downloaded_size > max_size:
-                            raise ToolError(f"File too large: exceeded {max_size} bytes", tool_name=self.name)
-                        f.write(chunk)
+                # Content-Length is the size on the wire; with a
+                # Content-Encoding the decoded body is a different size
+                preallocate = 0
+                if content_length and 'content-encoding' not in response.headers and hasattr(os, 'posix_fallocate'):
+                    preallocate = int(content_length)
+                
+                try:
+                    async with aiofiles.open(destination, 'wb') as f:
+                        if preallocate:
+                            try:
+                                # Reserve the extents up front to avoid fragmenting large
+                                # files. Off the loop: where the filesystem has no native
+                                # support, glibc emulates this by writing zeros
+                                await asyncio.to_thread(os.posix_fallocate, f.fileno(), 0, preallocate)
+                            except OSError:  # e.g. EINVAL on filesystems that refuse it
+                                preallocate = 0
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            downloaded_size += len(chunk)
+                            if downloaded_size > max_size:
+                                raise ToolError(f"File too large: exceeded {max_size} bytes", tool_name=self.name)
+                            await f.write(chunk)
+                        if downloaded_size < preallocate:
+                            # Body ended early: drop the unused reserved space
+                            await f.truncate(downloaded_size)
+                except BaseException:
+                    # A partial file, padded out to the preallocated size with
+                    # zeros, would look like a complete download
+                    with contextlib.suppress(OSError):
+                        os.remove(destination)
+                    raise
                 
                 return ToolResult(
                     success=True,
@@ -312,5 +746,5 @@ class WebOperationsTool(BaseTool):
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        # The session is shared with other tools; close_shared_session()
+        # closes it on application shutdown
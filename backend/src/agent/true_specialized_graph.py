@@ -9,7 +9,10 @@ This is the correct implementation that uses the specialized agent classes
 instead of simple LangGraph nodes.
 """
 
+import logging
 import os
+import threading
+from collections import ChainMap
 from typing import Dict, Any, Literal
 from datetime import datetime
 
@@ -29,45 +32,54 @@ from .specialized_state import (
     add_error_to_state
 )
 
-# Global agent instances
+logger = logging.getLogger(__name__)
+
+# Global agent instances (initialized once per process)
 research_agent = None
 analysis_agent = None
 synthesis_agent = None
 
+_AGENTS_INIT = False
+_AGENTS_LOCK = threading.Lock()
+
 
 def initialize_specialized_agents(config: RunnableConfig = None):
-    """Initialize the real specialized agent classes"""
-    global research_agent, analysis_agent, synthesis_agent
+    """Initialize the real specialized agent classes (once per process)"""
+    global research_agent, analysis_agent, synthesis_agent, _AGENTS_INIT
     
-    if research_agent is None:
-        from .specialized_agents.research_agent import ResearchAgent
-        research_agent = ResearchAgent(config)
-        print("✅ ResearchAgent (Real) initialized")
+    # Fast path: agents already built, no locking needed
+    if _AGENTS_INIT:
+        return
     
-    if analysis_agent is None:
+    with _AGENTS_LOCK:
+        if _AGENTS_INIT:
+            return
+
+        # Imported here so loading this module doesn't pull in agent.graph,
+        # which needs API credentials at import time
+        from .specialized_agents.research_agent import ResearchAgent
         from .specialized_agents.analysis_agent import AnalysisAgent
-        analysis_agent = AnalysisAgent(config)
-        print("✅ AnalysisAgent (Real) initialized")
-    
-    if synthesis_agent is None:
         from .specialized_agents.synthesis_agent import SynthesisAgent
+
+        research_agent = ResearchAgent(config)
+        analysis_agent = AnalysisAgent(config)
         synthesis_agent = SynthesisAgent(config)
-        print("✅ SynthesisAgent (Real) initialized")
+        _AGENTS_INIT = True
+        
+        logger.debug("Specialized agents (Real) initialized")
 
 
 @traceable(name="route_specialized_task")
 def route_specialized_task(state: SpecializedState, config: RunnableConfig) -> SpecializedState:
     """Route the task to the specialized workflow"""
-    print(f"🎯 Routing task to specialized 3-agent system...")
+    logger.debug("Routing task to specialized 3-agent system...")
     
-    updated_state = state.copy()
-    updated_state.update({
+    # Return only the changed keys; LangGraph merges them into the state
+    return {
         "workflow_stage": "routing",
         "current_agent": "router",
         "research_iteration": 0
-    })
-    
-    return updated_state
+    }
 
 
 @traceable(name="true_research_agent_node")
@@ -76,7 +88,7 @@ async def true_research_agent_node(state: SpecializedState, config: RunnableConf
     Research Agent Node - Uses the REAL ResearchAgent class with ii-agent logic
     """
     try:
-        print(f"🔍 ResearchAgent (Real) processing query...")
+        logger.debug("ResearchAgent (Real) processing query...")
         
         # Initialize the real specialized agents
         initialize_specialized_agents(config)
@@ -84,23 +96,19 @@ async def true_research_agent_node(state: SpecializedState, config: RunnableConf
         # Use the REAL ResearchAgent class
         result = await research_agent.execute(state)
         
-        # Update state with research results
-        updated_state = state.copy()
-        updated_state.update(result)
-        updated_state.update({
-            "current_agent": "research_agent",
-            "workflow_stage": "research"
-        })
+        # The agent's result is the update; LangGraph merges it into the state
+        result["current_agent"] = "research_agent"
+        result["workflow_stage"] = "research"
         
         confidence = result.get('research_confidence', 0)
-        print(f"✅ ResearchAgent (Real) completed - confidence: {confidence:.2f}")
-        return updated_state
+        logger.debug("ResearchAgent (Real) completed - confidence: %.2f", confidence)
+        return result
         
     except Exception as e:
-        print(f"❌ ResearchAgent (Real) failed: {e}")
+        logger.error("ResearchAgent (Real) failed: %s", e, exc_info=True)
         error_updates = add_error_to_state(state, e, "research_agent")
         error_updates["fallback_used"] = True
-        return {**state, **error_updates}
+        return error_updates
 
 
 @traceable(name="true_analysis_agent_node")
@@ -109,7 +117,7 @@ async def true_analysis_agent_node(state: SpecializedState, config: RunnableConf
     Analysis Agent Node - Uses the REAL AnalysisAgent class with gap analysis logic
     """
     try:
-        print(f"📊 AnalysisAgent (Real) evaluating research quality...")
+        logger.debug("AnalysisAgent (Real) evaluating research quality...")
         
         # Initialize the real specialized agents
         initialize_specialized_agents(config)
@@ -117,24 +125,20 @@ async def true_analysis_agent_node(state: SpecializedState, config: RunnableConf
         # Use the REAL AnalysisAgent class
         result = await analysis_agent.execute(state)
         
-        # Update state with analysis results
-        updated_state = state.copy()
-        updated_state.update(result)
-        updated_state.update({
-            "current_agent": "analysis_agent",
-            "workflow_stage": "analysis"
-        })
+        # The agent's result is the update; LangGraph merges it into the state
+        result["current_agent"] = "analysis_agent"
+        result["workflow_stage"] = "analysis"
         
         should_continue = result.get('should_continue_research', False)
-        print(f"✅ AnalysisAgent (Real) completed - Continue research: {should_continue}")
+        logger.debug("AnalysisAgent (Real) completed - Continue research: %s", should_continue)
         
-        return updated_state
+        return result
         
     except Exception as e:
-        print(f"❌ AnalysisAgent (Real) failed: {e}")
+        logger.error("AnalysisAgent (Real) failed: %s", e, exc_info=True)
         error_updates = add_error_to_state(state, e, "analysis_agent")
         error_updates["fallback_used"] = True
-        return {**state, **error_updates}
+        return error_updates
 
 
 @traceable(name="true_synthesis_agent_node")
@@ -143,7 +147,7 @@ async def true_synthesis_agent_node(state: SpecializedState, config: RunnableCon
     Synthesis Agent Node - Uses the REAL SynthesisAgent class with citation logic
     """
     try:
-        print(f"🔄 SynthesisAgent (Real) generating final answer...")
+        logger.debug("SynthesisAgent (Real) generating final answer...")
         
         # Initialize the real specialized agents
         initialize_specialized_agents(config)
@@ -151,27 +155,24 @@ async def true_synthesis_agent_node(state: SpecializedState, config: RunnableCon
         # Use the REAL SynthesisAgent class
         result = await synthesis_agent.execute(state)
         
-        # Update state with synthesis results
-        updated_state = state.copy()
-        updated_state.update(result)
-        updated_state.update({
-            "current_agent": "synthesis_agent",
-            "workflow_stage": "complete"
-        })
+        # The agent's result is the update; LangGraph merges it into the state
+        result["current_agent"] = "synthesis_agent"
+        result["workflow_stage"] = "complete"
         
-        # Calculate overall quality
-        overall_quality = calculate_overall_quality(updated_state)
-        updated_state["overall_quality_score"] = overall_quality
+        # Calculate overall quality over the state as it will be after this
+        # update, without building the merged dict
+        overall_quality = calculate_overall_quality(ChainMap(result, state))
+        result["overall_quality_score"] = overall_quality
         
-        print(f"✅ SynthesisAgent (Real) completed with quality score: {overall_quality:.2f}")
+        logger.debug("SynthesisAgent (Real) completed with quality score: %.2f", overall_quality)
         
-        return updated_state
+        return result
         
     except Exception as e:
-        print(f"❌ SynthesisAgent (Real) failed: {e}")
+        logger.error("SynthesisAgent (Real) failed: %s", e, exc_info=True)
         error_updates = add_error_to_state(state, e, "synthesis_agent")
         error_updates["fallback_used"] = True
-        return {**state, **error_updates}
+        return error_updates
 
 
 @traceable(name="evaluate_true_research_continuation")
@@ -181,10 +182,10 @@ def evaluate_true_research_continuation(state: SpecializedState, config: Runnabl
     """
     # Use the real logic from the AnalysisAgent
     if should_continue_research_iteration(state):
-        print(f"🔄 Continuing research - iteration {state.get('research_iteration', 0) + 1}")
+        logger.debug("Continuing research - iteration %d", state.get("research_iteration", 0) + 1)
         return "true_research_agent"
     else:
-        print(f"➡️ Proceeding to synthesis")
+        logger.debug("Proceeding to synthesis")
         return "true_synthesis_agent"
 
 
@@ -237,12 +238,6 @@ def build_true_specialized_graph() -> StateGraph:
     # Compile the graph
     graph = builder.compile(name="true-specialized-3-agent-system")
     
-    print("✅ TRUE Specialized 3-agent graph compiled successfully")
-    print("📊 Graph structure (REAL Agents):")
-    print("   Route Task → ResearchAgent (Real) → AnalysisAgent (Real)")
-    print("                        ↑                      ↓")
-    print("                        └── Continue? ──────────┘")
-    print("                                              ↓")
-    print("                                    SynthesisAgent (Real)")
+    logger.info("TRUE Specialized 3-agent graph compiled successfully")
     
     return graph
@@ -386,7 +386,7 @@ async def execute_tool(request: ToolExecutionRequest):
             success=result.success,
             tool_name=result.tool_name,
             action=request.action,
-            result=result.dict(),
+            result=result.model_dump(),
             execution_time=result.execution_time
         )
     except Exception as e:
@@ -408,7 +408,7 @@ async def search_tools(query: str):
                     "name": tool.name,
                     "description": tool.description,
                     "category": tool.category,
-                    "capabilities": [cap.dict() for cap in tool.get_capabilities()]
+                    "capabilities": tool.get_capability_dicts()
                 }
                 for tool in matching_tools
             ]
@@ -32,7 +32,7 @@ from memory.long_term_memory_manager import get_long_memory_manager
 from memory.short_term_memory_manager import get_short_memory_manager
 from agent.specialized_graph import build_specialized_graph
 from agent.true_specialized_graph import build_true_specialized_graph
-from agent.specialized_state import create_initial_state as create_specialized_state
+from agent.specialized_state import create_initial_state as create_specialized_state, get_execution_metrics as get_specialized_execution_metrics
 from monitoring.workflow_logging import log_workflow_execution
 from agent.graphs.graph_registry import get_graph_registry, get_specialized_graph, list_available_graphs
 from monitoring.langsmith_metrics import langsmith_monitor
@@ -302,7 +302,7 @@ async def run_true_specialized_workflow(query: str, config: Dict[str, Any]) -> D
             "final_answer": result.get("final_answer", ""),
             "citations": result.get("citations", []),
             "quality_score": result.get("overall_quality_score", 0.0),
-            "execution_metrics": result.get("execution_metrics", {}),
+            "execution_metrics": get_specialized_execution_metrics(result),
             "workflow_complete": result.get("workflow_stage") == "complete",
             "fallback_used": result.get("fallback_used", False),
             "agent_system": "true_specialized_agents"  # Identifier
@@ -343,7 +343,7 @@ async def run_specialized_workflow(query: str, config: Dict[str, Any]) -> Dict[s
             "final_answer": result.get("final_answer", ""),
             "citations": result.get("citations", []),
             "quality_score": result.get("overall_quality_score", 0.0),
-            "execution_metrics": result.get("execution_metrics", {}),
+            "execution_metrics": get_specialized_execution_metrics(result),
             "workflow_complete": result.get("workflow_stage") == "complete",
             "fallback_used": result.get("fallback_used", False),
             "agent_system": "basic_specialized_agents"  # Identifier
@@ -0,0 +1,140 @@
+"""
+Test Suite for FileOperationsTool
+Tests copy safety, sandboxing and the checksum action against a temp directory
+"""
+
+import pytest
+
+
+@pytest.fixture
+def file_tool(tmp_path):
+    """FileOperationsTool sandboxed to a fresh temp directory"""
+    from agent.tools.file_operations import FileOperationsTool
+
+    return FileOperationsTool(base_path=str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_copy_file_onto_itself_keeps_source(file_tool, tmp_path):
+    """Copying a file onto itself fails instead of truncating it"""
+    source = tmp_path / "notes.txt"
+    source.write_text("keep me")
+
+    result = await file_tool.safe_execute("copy_file", {
+        "source_path": str(source),
+        "destination_path": str(source),
+        "overwrite": True
+    })
+
+    assert not result.success
+    assert "same file" in result.error
+    assert source.read_text() == "keep me"
+
+
+def test_copy_file_data_rejects_same_file(tmp_path):
+    """The copy helper itself refuses a self-copy, as shutil.copy2 does"""
+    import shutil
+    from agent.tools.file_operations import _copy_file_data
+
+    source = tmp_path / "notes.txt"
+    source.write_text("keep me")
+
+    with pytest.raises(shutil.SameFileError):
+        _copy_file_data(source, source)
+    assert source.read_text() == "keep me"
+
+
+@pytest.mark.asyncio
+async def test_symlink_swapped_outside_base_is_rejected(tmp_path):
+    """A symlink repointed outside base_path fails validation on the next call"""
+    from agent.tools.file_operations import FileOperationsTool
+
+    base = tmp_path / "base"
+    inside = base / "data"
+    outside = tmp_path / "outside"
+    inside.mkdir(parents=True)
+    outside.mkdir()
+    (inside / "notes.txt").write_text("inside")
+    (outside / "notes.txt").write_text("secret")
+
+    link = base / "link"
+    link.symlink_to(inside, target_is_directory=True)
+    tool = FileOperationsTool(base_path=str(base))
+
+    result = await tool.safe_execute("read_file", {"file_path": str(link / "notes.txt")})
+    assert result.success
+    assert result.data["content"] == "inside"
+
+    # Repoint the link behind the tool's back
+    link.unlink()
+    link.symlink_to(outside, target_is_directory=True)
+
+    result = await tool.safe_execute("read_file", {"file_path": str(link / "notes.txt")})
+    assert not result.success
+    assert "outside allowed base path" in result.error
+
+
+@pytest.mark.asyncio
+async def test_file_tools_share_one_executor(tmp_path):
+    """Tools share a single pool, which is recreated after shutdown"""
+    from agent.tools import file_operations
+
+    first = file_operations.FileOperationsTool(base_path=str(tmp_path))
+    second = file_operations.FileOperationsTool(base_path=str(tmp_path))
+    await first._run_blocking(len, "")
+    executor = file_operations._EXECUTOR
+    await second._run_blocking(len, "")
+    assert file_operations._EXECUTOR is executor
+
+    await file_operations.close_file_executor()
+    assert file_operations._EXECUTOR is None
+    assert executor._shutdown
+
+    assert await first._run_blocking(len, "abc") == 3
+    assert file_operations._EXECUTOR is not executor
+    await file_operations.close_file_executor()
+
+
+@pytest.mark.asyncio
+async def test_checksum_files(file_tool, tmp_path):
+    """checksum_files hashes every file with the requested algorithm"""
+    import hashlib
+
+    first = tmp_path / "a.txt"
+    second = tmp_path / "b.txt"
+    first.write_bytes(b"alpha")
+    second.write_bytes(b"beta" * 100_000)
+
+    result = await file_tool.safe_execute("checksum_files", {"file_paths": [str(first), str(second)]})
+    assert result.success
+    assert result.data["algorithm"] == "sha256"
+    assert result.data["checksums"] == {
+        str(first): hashlib.sha256(b"alpha").hexdigest(),
+        str(second): hashlib.sha256(b"beta" * 100_000).hexdigest(),
+    }
+
+    result = await file_tool.safe_execute("checksum_files", {"file_paths": str(first), "algorithm": "md5"})
+    assert result.data["checksums"] == {str(first): hashlib.md5(b"alpha").hexdigest()}
+
+
+@pytest.mark.asyncio
+async def test_checksum_files_rejects_bad_input(file_tool, tmp_path):
+    """Unknown algorithms and missing files give failed results"""
+    existing = tmp_path / "a.txt"
+    existing.write_text("alpha")
+
+    result = await file_tool.safe_execute("checksum_files", {
+        "file_paths": [str(existing)], "algorithm": "not-a-hash"
+    })
+    assert not result.success
+    assert "Unsupported checksum algorithm" in result.error
+
+    for algorithm in ("shake_128", "shake_256"):
+        result = await file_tool.safe_execute("checksum_files", {
+            "file_paths": [str(existing)], "algorithm": algorithm
+        })
+        assert not result.success
+        assert "Unsupported checksum algorithm" in result.error
+
+    result = await file_tool.safe_execute("checksum_files", {"file_paths": [str(tmp_path / "missing.txt")]})
+    assert not result.success
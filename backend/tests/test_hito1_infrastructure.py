@@ -123,15 +123,15 @@ async def test_specialized_states():
         )
         
         # Test CodebaseAnalysisState
-        codebase_state = CodebaseAnalysisState()
-        assert hasattr(codebase_state, 'repository_url'), "CodebaseAnalysisState should have repository_url"
-        assert hasattr(codebase_state, 'analysis_type'), "CodebaseAnalysisState should have analysis_type"
-        assert hasattr(codebase_state, 'analysis_results'), "CodebaseAnalysisState should have analysis_results"
+        codebase_fields = CodebaseAnalysisState.__annotations__
+        assert 'repository_url' in codebase_fields, "CodebaseAnalysisState should have repository_url"
+        assert 'analysis_type' in codebase_fields, "CodebaseAnalysisState should have analysis_type"
+        assert 'analysis_results' in codebase_fields, "CodebaseAnalysisState should have analysis_results"
         
         # Test MemoryEnhancedState
-        memory_state = MemoryEnhancedState()
-        assert hasattr(memory_state, 'long_term_memories'), "MemoryEnhancedState should have long_term_memories"
-        assert hasattr(memory_state, 'short_term_cache'), "MemoryEnhancedState should have short_term_cache"
+        memory_fields = MemoryEnhancedState.__annotations__
+        assert 'long_term_memories' in memory_fields, "MemoryEnhancedState should have long_term_memories"
+        assert 'short_term_cache' in memory_fields, "MemoryEnhancedState should have short_term_cache"
         
         print("✅ Specialized states test passed")
         
@@ -0,0 +1,228 @@
+"""
+Test Suite for ProjectManagementTool
+Tests task indexing, list_tasks filtering and pagination, and bulk_tasks
+"""
+
+import pytest
+
+
+@pytest.fixture
+def pm_tool():
+    """Fresh ProjectManagementTool with empty in-memory storage"""
+    from agent.tools.project_management import ProjectManagementTool
+
+    return ProjectManagementTool()
+
+
+async def _create(tool, title, **fields):
+    result = await tool.safe_execute("create_task", {"title": title, "description": title, **fields})
+    assert result.success, result.error
+    return result.data["task"]
+
+
+async def _listed_ids(tool, **filters):
+    result = await tool.safe_execute("list_tasks", filters)
+    assert result.success, result.error
+    return [task["id"] for task in result.data["tasks"]]
+
+
+@pytest.mark.asyncio
+async def test_tag_index_follows_updates_after_caller_mutation(pm_tool):
+    """Mutating returned tags doesn't corrupt the tag index on the next update"""
+    tags = ["backend", "api"]
+    task = await _create(pm_tool, "Index me", tags=tags)
+
+    # Neither the caller's list nor the returned task decides what gets unindexed
+    tags.clear()
+    task["tags"].remove("api")
+
+    result = await pm_tool.safe_execute("update_task", {"task_id": task["id"], "tags": ["ops"]})
+    assert result.success
+
+    assert await _listed_ids(pm_tool, tags=["backend"]) == []
+    assert await _listed_ids(pm_tool, tags=["api"]) == []
+    assert await _listed_ids(pm_tool, tags=["ops"]) == [task["id"]]
+
+
+@pytest.mark.asyncio
+async def test_status_index_follows_updates(pm_tool):
+    """Updated tasks move between status buckets"""
+    first = await _create(pm_tool, "First")
+    second = await _create(pm_tool, "Second")
+
+    await pm_tool.safe_execute("update_task", {"task_id": first["id"], "status": "done"})
+
+    assert await _listed_ids(pm_tool, status="todo") == [second["id"]]
+    assert await _listed_ids(pm_tool, status="done") == [first["id"]]
+
+
+@pytest.mark.asyncio
+async def test_unhashable_values_are_rejected_before_storing(pm_tool):
+    """A task with an unindexable value is neither stored nor half-indexed"""
+    result = await pm_tool.safe_execute("create_task", {
+        "title": "Bad", "description": "Bad", "tags": [{"not": "hashable"}]
+    })
+    assert not result.success
+    assert pm_tool.tasks == {}
+
+    result = await pm_tool.safe_execute("create_task", {
+        "title": "Bad", "description": "Bad", "assignee": ["someone"]
+    })
+    assert not result.success
+    assert pm_tool.tasks == {}
+
+    task = await _create(pm_tool, "Good", tags=["keep"])
+    result = await pm_tool.safe_execute("update_task", {"task_id": task["id"], "status": {"bad": 1}})
+    assert not result.success
+    assert await _listed_ids(pm_tool, status="todo") == [task["id"]]
+    assert await _listed_ids(pm_tool, tags=["keep"]) == [task["id"]]
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_pagination(pm_tool):
+    """Pages follow creation order and report the next offset"""
+    ids = [(await _create(pm_tool, f"Task {n}"))["id"] for n in range(5)]
+
+    result = await pm_tool.safe_execute("list_tasks", {"limit": 2, "offset": 0})
+    assert [task["id"] for task in result.data["tasks"]] == ids[:2]
+    assert result.data["total_count"] == 5
+    assert result.data["next_offset"] == 2
+
+    result = await pm_tool.safe_execute("list_tasks", {"limit": "2", "offset": "4"})
+    assert [task["id"] for task in result.data["tasks"]] == ids[4:]
+    assert result.data["next_offset"] is None
+
+    result = await pm_tool.safe_execute("list_tasks", {"limit": None})
+    assert [task["id"] for task in result.data["tasks"]] == ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("paging", [
+    {"offset": -1},
+    {"limit": -5},
+    {"limit": "ten"},
+    {"limit": [2]},
+    {"offset": True},
+])
+async def test_list_tasks_rejects_bad_paging(pm_tool, paging):
+    """Invalid limit/offset values give a failed result, not a wrong page"""
+    await _create(pm_tool, "Only task")
+
+    result = await pm_tool.safe_execute("list_tasks", paging)
+
+    assert not result.success
+    assert "non-negative integers" in result.error
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_tag_filter_values(pm_tool):
+    """Mixed-type and single-string tag filters match like task tags do"""
+    numbered = await _create(pm_tool, "Numbered", tags=[1, "x"])
+    named = await _create(pm_tool, "Named", tags=["backend"])
+
+    assert await _listed_ids(pm_tool, tags=["x", 1]) == [numbered["id"]]
+    assert await _listed_ids(pm_tool, tags=[1, "x"]) == [numbered["id"]]
+    assert await _listed_ids(pm_tool, tags="backend") == [named["id"]]
+    assert await _listed_ids(pm_tool, tags=["backend", 1]) == [numbered["id"], named["id"]]
+
+    result = await pm_tool.safe_execute("list_tasks", {"tags": [["backend"]]})
+    assert not result.success
+
+
+@pytest.mark.asyncio
+async def test_bulk_tasks_creates_and_updates(pm_tool):
+    """bulk_tasks applies creates before updates and shares one timestamp"""
+    existing = await _create(pm_tool, "Existing")
+
+    result = await pm_tool.safe_execute("bulk_tasks", {
+        "creates": [
+            {"title": "A", "description": "a", "tags": ["bulk"]},
+            {"title": "B", "description": "b", "tags": ["bulk"]},
+        ],
+        "updates": [{"task_id": existing["id"], "status": "done"}]
+    })
+
+    assert result.success
+    created = result.data["created"]
+    assert len(created) == 2
+    assert result.data["updated"] == [existing["id"]]
+    assert result.data["errors"] == []
+    assert await _listed_ids(pm_tool, tags=["bulk"]) == created
+    assert await _listed_ids(pm_tool, status="done") == [existing["id"]]
+    assert pm_tool.tasks[created[0]]["created_at"] == pm_tool.tasks[existing["id"]]["updated_at"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_tasks_reports_bad_entries_and_keeps_going(pm_tool):
+    """Invalid entries are listed in errors while the rest of the batch applies"""
+    existing = await _create(pm_tool, "Existing")
+
+    result = await pm_tool.safe_execute("bulk_tasks", {
+        "creates": [
+            {"title": "Good", "description": "good"},
+            "not a dict",
+            {"title": "No description"},
+            {"title": "Bad tags", "description": "bad", "tags": [{"x": 1}]},
+        ],
+        "updates": [
+            ["not", "a", "dict"],
+            {"task_id": "task_999", "status": "done"},
+            {"task_id": existing["id"], "priority": {"bad": 1}},
+            {"task_id": existing["id"], "status": "in_progress"},
+        ]
+    })
+
+    assert result.success
+    assert len(result.data["created"]) == 1
+    assert result.data["updated"] == [existing["id"]]
+    failed = [(e.get("create"), e.get("update")) for e in result.data["errors"]]
+    assert failed == [(1, None), (2, None), (3, None), (None, 0), (None, 1), (None, 2)]
+    assert len(pm_tool.tasks) == 2
+    assert pm_tool.tasks[existing["id"]]["priority"] == "medium"
+    assert await _listed_ids(pm_tool, status="in_progress") == [existing["id"]]
+
+
+@pytest.mark.asyncio
+async def test_bulk_tasks_rejects_non_list_batches(pm_tool):
+    """creates/updates must be lists"""
+    result = await pm_tool.safe_execute("bulk_tasks", {"creates": {"title": "A", "description": "a"}})
+
+    assert not result.success
+    assert pm_tool.tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_cache_sees_writes(pm_tool):
+    """Cached list results are never served after a task write"""
+    first = await _create(pm_tool, "First", assignee="ana")
+    assert await _listed_ids(pm_tool, assignee="ana") == [first["id"]]
+
+    second = await _create(pm_tool, "Second", assignee="ana")
+    assert await _listed_ids(pm_tool, assignee="ana") == [first["id"], second["id"]]
+
+    await pm_tool.safe_execute("update_task", {"task_id": first["id"], "assignee": "luis"})
+    assert await _listed_ids(pm_tool, assignee="ana") == [second["id"]]
+    assert await _listed_ids(pm_tool, assignee="luis") == [first["id"]]
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_combines_filters(pm_tool):
+    """Several filters intersect; tag filters match any of the given tags"""
+    match = await _create(pm_tool, "Match", project_id="p1", priority="high", tags=["api"])
+    await _create(pm_tool, "Other project", project_id="p2", priority="high", tags=["api"])
+    await _create(pm_tool, "Other priority", project_id="p1", priority="low", tags=["api"])
+    untagged = await _create(pm_tool, "Untagged", project_id="p1", priority="high")
+
+    assert await _listed_ids(pm_tool, project_id="p1", priority="high", tags=["api", "ui"]) == [match["id"]]
+    assert await _listed_ids(pm_tool, project_id="p1", priority="high") == [match["id"], untagged["id"]]
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_without_limit_returns_everything(pm_tool):
+    """Without a limit every match comes back in one page, however many there are"""
+    ids = [(await _create(pm_tool, f"Task {n}"))["id"] for n in range(1200)]
+
+    result = await pm_tool.safe_execute("list_tasks", {"offset": 1})
+    assert [task["id"] for task in result.data["tasks"]] == ids[1:]
+    assert result.data["total_count"] == 1200
+    assert result.data["next_offset"] is None
@@ -0,0 +1,53 @@
+"""
+Test Suite for the specialized graph helpers
+Tests invoke_batch without calling any model
+"""
+
+import pytest
+
+
+class _RecordingGraph:
+    """Stands in for the compiled graph; echoes each state back"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def abatch(self, states, config=None):
+        self.calls.append((states, config))
+        return [{**state, "final_answer": f"answer to {state['original_query']}"} for state in states]
+
+
+@pytest.mark.asyncio
+async def test_invoke_batch_runs_queries_in_one_batch(monkeypatch):
+    """Every query becomes one initial state in a single abatch call, in order"""
+    from agent import specialized_graph
+
+    graph = _RecordingGraph()
+    monkeypatch.setattr(specialized_graph, "build_specialized_graph", lambda: graph)
+
+    results = await specialized_graph.invoke_batch(
+        ["first question", "second question"],
+        config={"configurable": {"thread_id": "batch"}},
+        max_concurrency=2
+    )
+
+    assert [result["final_answer"] for result in results] == [
+        "answer to first question", "answer to second question"
+    ]
+    (states, config), = graph.calls
+    assert [state["original_query"] for state in states] == ["first question", "second question"]
+    assert [state["messages"][0].content for state in states] == ["first question", "second question"]
+    assert config == {"configurable": {"thread_id": "batch"}, "max_concurrency": 2}
+
+
+@pytest.mark.asyncio
+async def test_invoke_batch_with_no_queries(monkeypatch):
+    """An empty batch returns at once without building the graph"""
+    from agent import specialized_graph
+
+    def fail():
+        raise AssertionError("graph should not be built")
+
+    monkeypatch.setattr(specialized_graph, "build_specialized_graph", fail)
+
+    assert await specialized_graph.invoke_batch([]) == []
@@ -0,0 +1,122 @@
+"""
+Test Suite for the specialized state helpers
+Tests the execution_metrics reducer and the update helpers built on it
+"""
+
+import copy
+
+import pytest
+
+
+def test_merge_metrics_applies_increments_once():
+    """Increments add to the current counts and never end up in the state"""
+    from agent.specialized_state import INCREMENTS_KEY, _merge_metrics
+
+    current = {"total_agents_used": 1, "has_research": True}
+    merged = _merge_metrics(current, {"has_analysis": True, INCREMENTS_KEY: {"total_agents_used": 1}})
+
+    assert merged == {"total_agents_used": 2, "has_research": True, "has_analysis": True}
+    assert current == {"total_agents_used": 1, "has_research": True}
+
+
+@pytest.mark.parametrize("clone", [dict, copy.deepcopy, lambda metrics: metrics])
+def test_merge_metrics_is_idempotent_for_copies(clone):
+    """Returning the current metrics, or a copy of them, counts nothing twice"""
+    from agent.specialized_state import _merge_metrics
+
+    current = {"total_agents_used": 2, "error_count": 1, "has_research": True}
+
+    assert _merge_metrics(current, clone(current)) == current
+
+
+def test_merge_metrics_starts_from_empty():
+    """The first update creates the metrics with increments counted from zero"""
+    from agent.specialized_state import INCREMENTS_KEY, _merge_metrics
+
+    assert _merge_metrics(None, {INCREMENTS_KEY: {"error_count": 1}}) == {"error_count": 1}
+    assert _merge_metrics(None, None) is None
+
+
+def test_update_helpers_count_agents_and_errors():
+    """Agent and error updates bump the counters through the reducer"""
+    from agent.specialized_state import (
+        _merge_metrics,
+        add_error_to_state,
+        create_initial_state,
+        get_execution_metrics,
+        update_state_with_analysis,
+        update_state_with_research,
+    )
+
+    state = create_initial_state(messages=[], query="What is LangGraph?")
+
+    def apply(update):
+        merged = {**state, **update}
+        merged["execution_metrics"] = _merge_metrics(state.get("execution_metrics"), update.get("execution_metrics"))
+        return merged
+
+    state = apply(update_state_with_research(state, ["q"], {}, "summary", 0.8))
+    # A node that returns the whole state back doesn't change the counts
+    state = apply(copy.deepcopy(state))
+    state = apply(update_state_with_analysis(state, {}, [], [], False, 0.6))
+    state = apply(add_error_to_state(state, ValueError("boom"), "synthesis_agent"))
+
+    metrics = get_execution_metrics(state)
+    assert metrics["total_agents_used"] == 2
+    assert metrics["error_count"] == 1
+    assert metrics["has_research"] and metrics["has_analysis"]
+    assert not metrics["has_synthesis"]
+    assert "_inc" not in state["execution_metrics"]
+
+
+def test_get_execution_metrics_applies_unreduced_increments():
+    """Metrics that skipped the reducer still report their increments"""
+    from agent.specialized_state import create_initial_state, get_execution_metrics, update_state_with_research
+
+    state = create_initial_state(messages=[], query="What is LangGraph?")
+    state = {**state, **update_state_with_research(state, ["q"], {}, "summary", 0.8)}
+
+    metrics = get_execution_metrics(state)
+    assert metrics["total_agents_used"] == 1
+    assert "_inc" not in metrics
+
+
+def test_compiled_graph_counts_every_agent():
+    """Agent updates sent through a real StateGraph are all counted"""
+    from langgraph.graph import END, START, StateGraph
+
+    from agent.specialized_state import (
+        SpecializedState,
+        create_initial_state,
+        get_execution_metrics,
+        update_state_with_analysis,
+        update_state_with_research,
+        update_state_with_synthesis,
+    )
+
+    def research(state):
+        return update_state_with_research(state, ["q"], {}, "summary", 0.8)
+
+    def analysis(state):
+        return update_state_with_analysis(state, {}, [], [], False, 0.6)
+
+    def synthesis(state):
+        return update_state_with_synthesis(state, {}, "answer", [], 0.9)
+
+    builder = StateGraph(SpecializedState)
+    builder.add_node("research", research)
+    builder.add_node("analysis", analysis)
+    builder.add_node("synthesis", synthesis)
+    builder.add_edge(START, "research")
+    builder.add_edge("research", "analysis")
+    builder.add_edge("analysis", "synthesis")
+    builder.add_edge("synthesis", END)
+    graph = builder.compile()
+
+    initial = create_initial_state(messages=[], query="What is LangGraph?")
+    for state in (initial, {k: v for k, v in initial.items() if k != "execution_metrics"}):
+        result = graph.invoke(state)
+        metrics = get_execution_metrics(result)
+        assert metrics["total_agents_used"] == 3
+        assert metrics["has_research"] and metrics["has_analysis"] and metrics["has_synthesis"]
+        assert "_inc" not in result["execution_metrics"]
@@ -0,0 +1,81 @@
+"""
+Test Suite for ToolRegistry
+Tests lazily registered tools and the registry's lookup paths
+"""
+
+import pytest
+
+
+@pytest.fixture
+def registry():
+    """Empty ToolRegistry"""
+    from agent.tools.registry import ToolRegistry
+
+    return ToolRegistry()
+
+
+def _counting_factory(builds):
+    from agent.tools.project_management import ProjectManagementTool
+
+    def factory():
+        builds.append(1)
+        return ProjectManagementTool()
+    return factory
+
+
+def test_lazy_tool_is_built_once_on_first_lookup(registry):
+    """A lazy tool shows in its category and is only built when looked up"""
+    builds = []
+    registry.register_lazy("project_management", _counting_factory(builds), "project_management")
+
+    assert builds == []
+    assert registry.get_categories() == ["project_management"]
+    assert registry.get_registry_status()["pending_tools"] == ["project_management"]
+
+    tool = registry.get_tool("project_management")
+    assert tool is not None
+    assert registry.get_tool("project_management") is tool
+    assert builds == [1]
+    assert registry.get_registry_status()["pending_tools"] == []
+    assert registry.get_tools_by_category("project_management") == [tool]
+
+
+def test_lookups_over_all_tools_build_pending_ones(registry):
+    """search_tools and get_all_tools see lazily registered tools"""
+    builds = []
+    registry.register_lazy("project_management", _counting_factory(builds), "project_management")
+
+    assert [tool.name for tool in registry.search_tools("milestone")] == ["project_management"]
+    assert list(registry.get_all_tools()) == ["project_management"]
+    assert "project_management" in registry.get_tool_capabilities()
+    assert builds == [1]
+
+
+def test_failing_factory_and_unregister(registry):
+    """A factory that raises yields no tool; pending tools can be unregistered"""
+    def broken():
+        raise RuntimeError("no backend")
+
+    registry.register_lazy("broken", broken, "misc")
+    assert registry.get_tool("broken") is None
+    assert registry.get_categories() == []
+
+    registry.register_lazy("project_management", _counting_factory([]), "project_management")
+    assert registry.unregister_tool("project_management")
+    assert registry.get_tool("project_management") is None
+    assert registry.get_categories() == []
+
+
+def test_default_registry_registers_tools_lazily():
+    """The global registry starts with the default tools pending"""
+    from agent.tools import registry as registry_module
+
+    registry_module.reset_registry()
+    try:
+        registry = registry_module.get_tool_registry()
+        assert registry.get_registry_status()["pending_tools"] == [
+            "file_operations", "project_management", "web_operations"
+        ]
+        assert registry.get_tool("web_operations").name == "web_operations"
+    finally:
+        registry_module.reset_registry()
@@ -0,0 +1,178 @@
+"""
+Test Suite for WebOperationsTool
+Tests the conditional GET cache and downloads against a local aiohttp server
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+
+ETAG = '"page-v1"'
+
+
+@pytest_asyncio.fixture
+async def page_server():
+    """Local server answering with an ETag and honouring If-None-Match"""
+    requests = []
+
+    async def page(request):
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        body = "<html><body>" + "x" * 4096 + "</body></html>"
+        return web.Response(text=body, content_type="text/html", headers={"ETag": ETAG})
+
+    async def short_body(request):
+        # Promises more than it sends, then drops the connection
+        response = web.StreamResponse(headers={"Content-Length": "65536"})
+        await response.prepare(request)
+        await response.write(b"x" * 1024)
+        request.transport.close()
+        return response
+
+    async def chunked(request):
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for _ in range(8):
+            await response.write(b"x" * 1024)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    app.router.add_get("/short", short_body)
+    app.router.add_get("/chunked", chunked)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}", requests
+
+    await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def web_tool():
+    """WebOperationsTool with an empty conditional cache"""
+    from agent.tools import web_operations
+
+    web_operations._conditional_cache.clear()
+    web_operations._conditional_cache_bytes = 0
+    yield web_operations.WebOperationsTool()
+    web_operations._conditional_cache.clear()
+    web_operations._conditional_cache_bytes = 0
+    await web_operations.close_shared_session()
+
+
+@pytest.mark.asyncio
+async def test_truncated_page_stays_truncated_on_revalidation(page_server, web_tool, monkeypatch):
+    """A 304 for a cached truncated page still reports it as truncated"""
+    from agent.tools import web_operations
+
+    monkeypatch.setattr(web_operations, "MAX_HTML_BYTES", 1024)
+    base_url, requests = page_server
+
+    first = await web_tool.safe_execute("fetch_webpage", {"url": f"{base_url}/page"})
+    assert first.success
+    assert first.data["truncated"] is True
+    assert first.data["from_cache"] is False
+
+    second = await web_tool.safe_execute("fetch_webpage", {"url": f"{base_url}/page"})
+    assert second.success
+    assert requests[-1].get("If-None-Match") == ETAG
+    assert second.data["from_cache"] is True
+    assert second.data["truncated"] is True
+    assert second.data["content_length"] == first.data["content_length"]
+
+
+@pytest.mark.asyncio
+async def test_conditional_cache_skips_oversized_bodies(page_server, web_tool, monkeypatch):
+    """Bodies above the per-entry limit are not kept in the cache"""
+    from agent.tools import web_operations
+
+    monkeypatch.setattr(web_operations, "CONDITIONAL_CACHE_MAX_ENTRY_BYTES", 1024)
+    base_url, requests = page_server
+
+    result = await web_tool.safe_execute("fetch_webpage", {"url": f"{base_url}/page"})
+    assert result.success
+    assert not web_operations._conditional_cache
+    assert web_operations._conditional_cache_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_conditional_cache_evicts_to_byte_budget(page_server, web_tool, monkeypatch):
+    """The cache evicts the oldest entries once the byte budget is exceeded"""
+    from agent.tools import web_operations
+
+    base_url, requests = page_server
+    first = await web_tool.safe_execute("http_request", {"url": f"{base_url}/page", "method": "GET"})
+    assert first.success
+    entry_size = web_operations._conditional_cache_bytes
+    assert entry_size > 0
+
+    monkeypatch.setattr(web_operations, "CONDITIONAL_CACHE_MAX_BYTES", entry_size)
+    second = await web_tool.safe_execute("http_request", {
+        "url": f"{base_url}/page", "method": "GET", "params": {"v": "2"}
+    })
+    assert second.success
+    assert len(web_operations._conditional_cache) == 1
+    assert web_operations._conditional_cache_bytes == entry_size
+
+
+@pytest.mark.asyncio
+async def test_failed_download_leaves_no_file(page_server, web_tool, tmp_path):
+    """A body cut short of its Content-Length doesn't leave a padded file behind"""
+    base_url, _ = page_server
+    destination = tmp_path / "file.bin"
+
+    result = await web_tool.safe_execute("download_file", {
+        "url": f"{base_url}/short",
+        "destination": str(destination)
+    })
+
+    assert not result.success
+    assert not destination.exists()
+
+
+@pytest.mark.asyncio
+async def test_download_over_max_size_leaves_no_file(page_server, web_tool, tmp_path):
+    """Exceeding max_size mid-stream removes the partial file"""
+    base_url, _ = page_server
+    destination = tmp_path / "file.bin"
+
+    result = await web_tool.safe_execute("download_file", {
+        "url": f"{base_url}/chunked",
+        "destination": str(destination),
+        "max_size": 4096
+    })
+
+    assert not result.success
+    assert "File too large" in result.error
+    assert not destination.exists()
+
+    result = await web_tool.safe_execute("download_file", {
+        "url": f"{base_url}/chunked",
+        "destination": str(destination)
+    })
+    assert result.success
+    assert destination.stat().st_size == 8 * 1024
+
+
+def test_shared_session_closes_with_its_loop():
+    """A session from a finished asyncio.run() loop is closed, not leaked"""
+    import asyncio
+    from agent.tools import web_operations
+
+    async def get_session():
+        return web_operations._get_shared_session()
+
+    first = asyncio.run(get_session())
+    assert first.closed
+
+    second = asyncio.run(get_session())
+    assert second is not first
+    assert second.closed